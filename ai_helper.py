@@ -4,15 +4,304 @@ Handles AI-powered documentation generation and text-to-speech
 """
 
 import os
+import time
+import asyncio
+import hashlib
+import functools
+import itertools
+import logging
+import sqlite3
+import threading
+from pathlib import Path
+import httpx
+import tenacity
+from aiolimiter import AsyncLimiter
 import google.generativeai as genai
-from elevenlabs.client import ElevenLabs
-from typing import Dict, Tuple
+import google.ai.generativelanguage as glm
+from google.api_core import exceptions as google_exceptions
+from elevenlabs.client import ElevenLabs, AsyncElevenLabs
+from aioloop import call_on_loop, run_on_loop, run_sync
+from importlib.util import find_spec
+from typing import Dict, Iterator, List, Optional, Tuple, Union
 import re
 
 
+logger = logging.getLogger(__name__)
+
+# Files documented per Gemini request when processing a batch
+DEFAULT_BATCH_SIZE = 8
+
+# Max requests in flight at once when processing a batch
+DEFAULT_CONCURRENCY = 10
+
+# Line and sentence boundaries used when extracting the summary
+_LINE_SPLIT = re.compile(r'\n')
+_SENT_SPLIT = re.compile(r'[.!?]+')
+
+# Source longer than this is clipped to a head/tail window before prompting
+# (~4 chars per token, so roughly 3k input tokens per file)
+MAX_CODE_CHARS = 12_000
+
+# Added to the prompt when a file had to be clipped
+_TRUNCATION_NOTE = """
+Note: the middle of this file was omitted for length where marked "[truncated ...]". Document only the code shown and do not guess at the omitted part.
+"""
+
+# Static instructions sent as the system instruction, so every request starts with the
+# same prefix for Gemini's implicit context caching
+SYSTEM_INSTRUCTIONS = """You write documentation for source code.
+
+For each code file you are given, generate comprehensive documentation in README markdown format with these sections:
+1. **Overview** - What this code does (2-3 sentences)
+2. **Key Components** - Main functions/classes with brief descriptions
+3. **Usage Examples** - How to use this code (with code blocks)
+4. **Dependencies** - Required libraries/packages
+5. **Installation** - Setup instructions
+
+Then provide a STRICT 2-LINE SUMMARY (maximum 2 sentences, around 150-200 characters total) that captures the essence of that code.
+
+Unless told otherwise, format your response EXACTLY like this:
+
+## Documentation
+
+[Full documentation here in markdown format]
+
+## Summary
+
+[Exactly 2 lines/sentences here - be concise and clear]
+"""
+
+# Per-request prompt for documenting a single file
+_PROMPT_TMPL = """Analyze this {language} code from file "{filename}":
+
+```{language}
+{code}
+```
+{note}"""
+
+# Per-request prompt for documenting several files at once, and the block for each file
+_BATCH_FILE_TMPL = """=== FILE {index}: {filename} ({language}) ===
+```{language}
+{code}
+```{note}"""
+
+_BATCH_PROMPT_TMPL = """Analyze each of the following {count} code files:
+
+{files}
+
+Document EACH file, with one block per file in the same order, formatted EXACTLY like this:
+
+## FILE 1
+
+## Documentation
+
+[Full documentation for file 1 here in markdown format]
+
+## Summary
+
+[Exactly 2 lines/sentences here - be concise and clear]
+
+## FILE 2
+
+...
+"""
+
+# Client-side request budgets per API key (requests per minute), kept just
+# under the provider quotas so batch runs don't trip 429 backoff storms
+GEMINI_QPM = int(os.environ.get("GEMINI_QPM", "500"))
+ELEVENLABS_QPM = int(os.environ.get("ELEVENLABS_QPM", "100"))
+
+# Gemini model used for documentation
+GEMINI_MODEL = 'gemini-2.5-flash'
+
+# Connection pool shared by the ElevenLabs clients so keep-alive survives across calls
+HTTP_LIMITS = httpx.Limits(max_keepalive_connections=32)
+
+# HTTP/2 needs httpx's optional h2 dependency; plain httpx falls back to HTTP/1.1
+HTTP2_ENABLED = find_spec("h2") is not None
+
+# Bump whenever the prompt changes so stale cached documentation isn't served
+PROMPT_VERSION = "2"
+
+# ElevenLabs voice and model used for the audio summary. Flash is the
+# low-latency model and is plenty for a 2-sentence summary; callers can opt
+# up to "eleven_multilingual_v2" for long-form narration.
+VOICE_ID = "EXAVITQu4vr4xnSDxMaL"  # Rachel voice ID
+TTS_MODEL_ID = "eleven_flash_v2_5"
+TTS_OUTPUT_FORMAT = "mp3_44100_128"
+
+# Text shorter than this isn't worth a paid TTS call; longer text is capped so a
+# bad parse can't bill for a whole document
+MIN_TTS_CHARS = 8
+MAX_TTS_CHARS = 1000
+
+# On-disk cache for generated documentation and audio
+CACHE_DIR = Path(os.environ.get("GITNEXUS_CACHE_DIR", Path.home() / ".cache" / "gitnexus"))
+CACHE_DB = CACHE_DIR / "cache.sqlite3"
+
+# Cached entries expire after this many seconds (default 30 days)
+CACHE_TTL = int(os.environ.get("GITNEXUS_CACHE_TTL", str(30 * 24 * 3600)))
+
+# Shared connection to the cache database, opened on first use
+_cache_db = None
+_cache_db_lock = threading.Lock()
+
+def _is_transient(exc: BaseException) -> bool:
+    """Whether an API error is worth retrying (rate limits, server errors, timeouts)"""
+    if isinstance(exc, (google_exceptions.ResourceExhausted, google_exceptions.ServiceUnavailable,
+                        google_exceptions.InternalServerError, google_exceptions.DeadlineExceeded,
+                        httpx.TimeoutException, httpx.NetworkError)):
+        return True
+    # ElevenLabs raises ApiError carrying the HTTP status
+    status = getattr(exc, "status_code", None)
+    return isinstance(status, int) and (status == 429 or status >= 500)
+
+
+# Retry transient failures with jittered exponential backoff, re-raising the
+# original exception once attempts run out
+_retry_transient = tenacity.retry(
+    retry=tenacity.retry_if_exception(_is_transient),
+    wait=tenacity.wait_exponential_jitter(initial=1, max=30),
+    stop=tenacity.stop_after_attempt(4),
+    reraise=True
+)
+
+
+def _first_n_nonblank(text: str, n: int, separator: re.Pattern) -> Iterator[str]:
+    """Yield the first n non-blank, stripped pieces of text, scanning no further than needed"""
+    count = 0
+    start = 0
+    for match in separator.finditer(text):
+        piece = text[start:match.start()].strip()
+        start = match.end()
+        if piece:
+            yield piece
+            count += 1
+            if count == n:
+                return
+    piece = text[start:].strip()
+    if piece:
+        yield piece
+
+
+def _prepare_tts_text(text: str) -> Optional[str]:
+    """Strip and cap text for TTS, or return None if it's too short to voice"""
+    text = text.strip()
+    if len(text) < MIN_TTS_CHARS:
+        return None
+    return text[:MAX_TTS_CHARS]
+
+
+def _clip_code(code: str, max_chars: int = MAX_CODE_CHARS) -> str:
+    """
+    Clip code to a head/tail window of at most max_chars
+    
+    Keeps the first three quarters of the budget from the top of the file
+    (imports, main definitions) and the rest from the bottom (exports, entry point).
+    """
+    if len(code) <= max_chars:
+        return code
+    head = code[:max_chars * 3 // 4]
+    tail = code[-(max_chars // 4):]
+    return f"{head}\n... [truncated {len(code) - len(head) - len(tail)} chars] ...\n{tail}"
+
+
+def _content_hash(*parts: str) -> str:
+    """Hash the given strings into a short cache key"""
+    digest = hashlib.blake2b(digest_size=16)
+    for part in parts:
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def _cache_query(sql: str, params: Tuple = ()) -> Optional[Tuple]:
+    """
+    Run one statement against the cache database and return the first row
+    
+    The database and its tables are created on first use, and expired rows are
+    purged then. Caching is best-effort, so database errors are treated as misses.
+    """
+    global _cache_db
+    try:
+        with _cache_db_lock:
+            if _cache_db is None:
+                CACHE_DIR.mkdir(parents=True, exist_ok=True)
+                db = sqlite3.connect(CACHE_DB, check_same_thread=False, isolation_level=None)
+                db.execute("PRAGMA journal_mode=WAL")
+                db.execute("CREATE TABLE IF NOT EXISTS docs (key TEXT PRIMARY KEY, documentation TEXT NOT NULL, summary TEXT NOT NULL, expires_at REAL NOT NULL)")
+                db.execute("CREATE TABLE IF NOT EXISTS audio (key TEXT PRIMARY KEY, audio BLOB NOT NULL, expires_at REAL NOT NULL)")
+                now = time.time()
+                db.execute("DELETE FROM docs WHERE expires_at < ?", (now,))
+                db.execute("DELETE FROM audio WHERE expires_at < ?", (now,))
+                _cache_db = db
+            return _cache_db.execute(sql, params).fetchone()
+    except (sqlite3.Error, OSError) as e:
+        logger.debug("Cache unavailable: %s", e)
+        return None
+
+
+@functools.lru_cache(maxsize=512)
+def _read_cached_docs(key: str) -> Tuple[str, str]:
+    """Read cached documentation from disk (misses raise, so they aren't memoized)"""
+    row = _cache_query("SELECT documentation, summary FROM docs WHERE key = ? AND expires_at >= ?", (key, time.time()))
+    if row is None:
+        raise KeyError(key)
+    return row
+
+
+@functools.lru_cache(maxsize=64)
+def _read_cached_audio(key: str) -> bytes:
+    """Read cached audio from disk (misses raise, so they aren't memoized)"""
+    row = _cache_query("SELECT audio FROM audio WHERE key = ? AND expires_at >= ?", (key, time.time()))
+    if row is None:
+        raise KeyError(key)
+    return row[0]
+
+
+def _load_docs(key: str) -> Optional[Dict[str, str]]:
+    """Return cached documentation for key, or None on a miss"""
+    try:
+        documentation, summary = _read_cached_docs(key)
+    except KeyError:
+        return None
+    return {"documentation": documentation, "summary": summary}
+
+
+def _load_audio(key: str) -> Optional[bytes]:
+    """Return cached audio for key, or None on a miss"""
+    try:
+        return _read_cached_audio(key)
+    except KeyError:
+        return None
+
+
+def _store_docs(key: str, result: Dict[str, str]):
+    """Persist documentation for key"""
+    _cache_query(
+        "INSERT OR REPLACE INTO docs (key, documentation, summary, expires_at) VALUES (?, ?, ?, ?)",
+        (key, result["documentation"], result["summary"], time.time() + CACHE_TTL)
+    )
+
+
+def _store_audio(key: str, audio: bytes):
+    """Persist audio for key"""
+    _cache_query(
+        "INSERT OR REPLACE INTO audio (key, audio, expires_at) VALUES (?, ?, ?)",
+        (key, audio, time.time() + CACHE_TTL)
+    )
+
+
 class AIDocumentationGenerator:
     """AI-powered code documentation generator with TTS"""
     
+    # SDK clients shared by every instance, so each request reuses the same
+    # connection pool instead of paying for a fresh TLS handshake
+    _gemini_models = {}
+    _elevenlabs_clients = {}
+    _rate_limiters = {}
+    _clients_lock = threading.Lock()
+    
     def __init__(self, user_gemini_key: str = None):
         """
         Initialize AI services with API keys
@@ -23,18 +312,70 @@ class AIDocumentationGenerator:
         # Initialize Gemini - prioritize user key, then env var
         self.gemini_key = user_gemini_key or os.environ.get("GEMINI_API_KEY")
         
-        if self.gemini_key:
-            genai.configure(api_key=self.gemini_key)
-            self.gemini_model = genai.GenerativeModel('gemini-2.5-flash')
-        else:
-            self.gemini_model = None
-        
-        # Initialize ElevenLabs
+        # Initialize ElevenLabs (sync client for single calls, async client for batches)
         self.elevenlabs_key = os.environ.get("ELEVENLABS_API_KEY")
         if self.elevenlabs_key:
-            self.elevenlabs_client = ElevenLabs(api_key=self.elevenlabs_key)
+            self.elevenlabs_client, self.async_elevenlabs_client = self.get_elevenlabs(self.elevenlabs_key)
         else:
             self.elevenlabs_client = None
+            self.async_elevenlabs_client = None
+    
+    @property
+    def gemini_model(self) -> Optional[genai.GenerativeModel]:
+        """Shared Gemini model for this instance's key, or None if no key is configured"""
+        return self.get_gemini(self.gemini_key) if self.gemini_key else None
+    
+    @classmethod
+    def get_gemini(cls, api_key: str) -> genai.GenerativeModel:
+        """
+        Get the shared Gemini model for an API key
+        
+        Args:
+            api_key: Gemini API key
+        
+        Returns:
+            GenerativeModel configured for that key
+        """
+        with cls._clients_lock:
+            model = cls._gemini_models.get(api_key)
+        if model is not None:
+            return model
+        
+        # Bind the model to this key's own clients up front. Left unset, it binds
+        # whatever key the process-wide genai.configure holds on its first call.
+        # The grpc.aio client belongs to the loop it is created on, so it's built
+        # on the background loop (outside the lock, which that loop also takes).
+        model = genai.GenerativeModel(GEMINI_MODEL, system_instruction=SYSTEM_INSTRUCTIONS)
+        client_options = {"api_key": api_key}
+        model._client = glm.GenerativeServiceClient(client_options=client_options)
+        model._async_client = call_on_loop(glm.GenerativeServiceAsyncClient, client_options=client_options)
+        
+        with cls._clients_lock:
+            return cls._gemini_models.setdefault(api_key, model)
+    
+    @classmethod
+    def get_elevenlabs(cls, api_key: str) -> Tuple[ElevenLabs, AsyncElevenLabs]:
+        """
+        Get the shared ElevenLabs clients for an API key
+        
+        The async client's connection pool is bound to the loop it was opened
+        on, so it is only ever driven from the shared background loop (see
+        _call_elevenlabs_async), whichever loop the caller awaits from.
+        
+        Args:
+            api_key: ElevenLabs API key
+        
+        Returns:
+            Tuple of (sync client, async client)
+        """
+        with cls._clients_lock:
+            clients = cls._elevenlabs_clients.get(api_key)
+            if clients is None:
+                clients = cls._elevenlabs_clients[api_key] = (
+                    ElevenLabs(api_key=api_key, httpx_client=httpx.Client(http2=HTTP2_ENABLED, limits=HTTP_LIMITS)),
+                    AsyncElevenLabs(api_key=api_key, httpx_client=httpx.AsyncClient(http2=HTTP2_ENABLED, limits=HTTP_LIMITS))
+                )
+            return clients
     
     def generate_documentation(self, code_content: str, language: str, filename: str) -> Dict[str, str]:
         """
@@ -44,104 +385,323 @@ class AIDocumentationGenerator:
             code_content: The source code to analyze
             language: Programming language (python, javascript, etc.)
             filename: Original filename
-            
+        
         Returns:
             Dict with 'documentation' and 'summary' keys
         """
         if not self.gemini_model:
             raise ValueError("Gemini API key not configured. Set GEMINI_API_KEY environment variable.")
         
-        # Create prompt for Gemini
-        prompt = f"""Analyze this {language} code from file "{filename}":
-
-```{language}
-{code_content}
-```
-
-Generate comprehensive documentation in README markdown format with these sections:
-1. **Overview** - What this code does (2-3 sentences)
-2. **Key Components** - Main functions/classes with brief descriptions
-3. **Usage Examples** - How to use this code (with code blocks)
-4. **Dependencies** - Required libraries/packages
-5. **Installation** - Setup instructions
-
-Then provide a STRICT 2-LINE SUMMARY (maximum 2 sentences, around 150-200 characters total) that captures the essence of this code.
-
-Format your response EXACTLY like this:
-
-## Documentation
-
-[Full documentation here in markdown format]
-
-## Summary
-
-[Exactly 2 lines/sentences here - be concise and clear]
-"""
+        # Identical code yields identical docs, so skip Gemini on a cache hit
+        cache_key = self._docs_cache_key(code_content, language, filename)
+        cached = _load_docs(cache_key)
+        if cached:
+            return cached
+        
+        # Generate content with Gemini
+        prompt = self._build_prompt(code_content, language, filename)
+        result = self._parse_response(self._call_gemini(prompt))
+        
+        _store_docs(cache_key, result)
+        return result
+    
+    async def generate_documentation_async(self, code_content: str, language: str, filename: str) -> Dict[str, str]:
+        """
+        Async variant of generate_documentation
+        
+        Args:
+            code_content: The source code to analyze
+            language: Programming language (python, javascript, etc.)
+            filename: Original filename
+        
+        Returns:
+            Dict with 'documentation' and 'summary' keys
+        """
+        if not self.gemini_model:
+            raise ValueError("Gemini API key not configured. Set GEMINI_API_KEY environment variable.")
+        
+        cache_key = self._docs_cache_key(code_content, language, filename)
+        cached = _load_docs(cache_key)
+        if cached:
+            return cached
+        
+        prompt = self._build_prompt(code_content, language, filename)
+        result = self._parse_response(await self._call_gemini_async(prompt))
+        
+        _store_docs(cache_key, result)
+        return result
+    
+    async def generate_documentation_batch_async(self, items: List[Dict[str, str]]) -> List[Dict[str, str]]:
+        """
+        Document several files with a single Gemini request
+        
+        If the combined response can't be split back into one section per file,
+        the batch is halved and each half retried, down to single-file requests.
+        
+        Args:
+            items: Dicts with 'code_content', 'language' and 'filename' keys
+        
+        Returns:
+            List of dicts with 'documentation' and 'summary' keys, one per item
+        """
+        # Only send the files that aren't cached yet
+        cached = [_load_docs(self._docs_cache_key(item["code_content"], item["language"], item["filename"])) for item in items]
+        misses = [item for item, hit in zip(items, cached) if not hit]
+        if not misses:
+            return cached
+        if len(misses) < len(items):
+            fresh = iter(await self.generate_documentation_batch_async(misses))
+            return [hit or next(fresh) for hit in cached]
+        
+        if len(items) == 1:
+            item = items[0]
+            return [await self.generate_documentation_async(item["code_content"], item["language"], item["filename"])]
+        
+        if not self.gemini_model:
+            raise ValueError("Gemini API key not configured. Set GEMINI_API_KEY environment variable.")
+        
+        response_text = await self._call_gemini_async(self._build_batch_prompt(items))
         
         try:
-            # Generate content with Gemini
-            response = self.gemini_model.generate_content(prompt)
-            full_response = response.text
-            
-            # Parse documentation and summary
-            parts = full_response.split("## Summary")
-            
-            if len(parts) == 2:
-                documentation = parts[0].replace("## Documentation", "").strip()
-                summary = parts[1].strip()
-                
-                # Ensure summary is max 2 lines
-                summary_lines = [line.strip() for line in summary.split('\n') if line.strip()]
-                summary = ' '.join(summary_lines[:2])
-            else:
-                # Fallback if format is not as expected
-                documentation = full_response
-                summary = self._extract_summary_fallback(full_response)
-            
-            return {
-                "documentation": documentation,
-                "summary": summary
-            }
+            results = self._parse_batch_response(response_text, len(items))
+        except ValueError:
+            middle = len(items) // 2
+            first, second = await asyncio.gather(
+                self.generate_documentation_batch_async(items[:middle]),
+                self.generate_documentation_batch_async(items[middle:])
+            )
+            return first + second
+        
+        for item, result in zip(items, results):
+            _store_docs(self._docs_cache_key(item["code_content"], item["language"], item["filename"]), result)
+        return results
+    
+    def generate_documentation_batch(self, items: List[Dict[str, str]]) -> List[Dict[str, str]]:
+        """
+        Sync wrapper around generate_documentation_batch_async
+        
+        Args:
+            items: Dicts with 'code_content', 'language' and 'filename' keys
+        
+        Returns:
+            List of dicts with 'documentation' and 'summary' keys, one per item
+        """
+        return run_sync(self.generate_documentation_batch_async(items))
+    
+    @classmethod
+    def get_rate_limiter(cls, provider: str, api_key: str, max_per_minute: int) -> AsyncLimiter:
+        """
+        Get the shared rate limiter for a provider and API key
+        
+        Args:
+            provider: Provider name ("gemini" or "elevenlabs")
+            api_key: API key the budget applies to
+            max_per_minute: Requests allowed per minute
+        
+        Returns:
+            AsyncLimiter shared by every instance using that key
+        """
+        with cls._clients_lock:
+            limiter = cls._rate_limiters.get((provider, api_key))
+            if limiter is None:
+                limiter = cls._rate_limiters[(provider, api_key)] = AsyncLimiter(max_per_minute, 60)
+            return limiter
+    
+    @_retry_transient
+    def _call_gemini(self, prompt: str) -> str:
+        """Send a prompt to Gemini, retrying transient failures"""
+        return self.gemini_model.generate_content(prompt).text
+    
+    @_retry_transient
+    async def _call_gemini_async(self, prompt: str) -> str:
+        """Async variant of _call_gemini, run on the shared background loop"""
+        return await run_on_loop(self._send_gemini_async(prompt))
+    
+    async def _send_gemini_async(self, prompt: str) -> str:
+        """Send a prompt from the background loop, paced by the per-key rate limiter"""
+        async with self.get_rate_limiter("gemini", self.gemini_key, GEMINI_QPM):
+            response = await self.gemini_model.generate_content_async(prompt)
+        return response.text
+    
+    def _docs_cache_key(self, code_content: str, language: str, filename: str) -> str:
+        """Cache key for documentation of code_content, namespaced by language and file extension"""
+        extension = os.path.splitext(filename)[1].lower()
+        return _content_hash(language, extension, code_content, PROMPT_VERSION)
+    
+    def _build_prompt(self, code_content: str, language: str, filename: str) -> str:
+        """Build the Gemini documentation prompt for a single file"""
+        clipped = _clip_code(code_content)
+        note = _TRUNCATION_NOTE if clipped is not code_content else ""
+        return _PROMPT_TMPL.format(language=language, filename=filename, code=clipped, note=note)
+    
+    def _build_batch_prompt(self, items: List[Dict[str, str]]) -> str:
+        """Build one Gemini prompt documenting every file in items"""
+        blocks = []
+        for i, item in enumerate(items, 1):
+            clipped = _clip_code(item["code_content"])
+            note = _TRUNCATION_NOTE if clipped is not item["code_content"] else ""
+            blocks.append(_BATCH_FILE_TMPL.format(index=i, filename=item["filename"], language=item["language"],
+                                                  code=clipped, note=note))
+        files = "\n\n".join(blocks)
+        return _BATCH_PROMPT_TMPL.format(count=len(items), files=files)
+    
+    def _parse_batch_response(self, full_response: str, count: int) -> List[Dict[str, str]]:
+        """
+        Split a batched Gemini response into one result per file
+        
+        Raises:
+            ValueError: If the response doesn't contain a complete block for every file
+        """
+        sections = {}
+        for block in full_response.split("## FILE ")[1:]:
+            number, _, body = block.partition("\n")
+            number = number.strip()
+            if number.isdigit() and "## Summary" in body:
+                sections[int(number)] = body
+        
+        if sorted(sections) != list(range(1, count + 1)):
+            raise ValueError(f"Expected {count} file sections, got {len(sections)}")
+        
+        return [self._parse_response(sections[i]) for i in range(1, count + 1)]
+    
+    def _parse_response(self, full_response: str) -> Dict[str, str]:
+        """Split a Gemini response into documentation and a 2-line summary"""
+        head, sep, tail = full_response.partition("## Summary")
+        
+        if sep:
+            documentation = head.replace("## Documentation", "").strip()
             
-        except Exception as e:
-            raise Exception(f"Failed to generate documentation: {str(e)}")
+            # Ensure summary is max 2 lines, without splitting the whole tail
+            summary = ' '.join(_first_n_nonblank(tail, 2, _LINE_SPLIT))
+        else:
+            # Fallback if format is not as expected
+            documentation = full_response
+            summary = self._extract_summary_fallback(full_response)
+        
+        return {
+            "documentation": documentation,
+            "summary": summary
+        }
     
     def _extract_summary_fallback(self, text: str) -> str:
         """Extract a 2-line summary if the format is not as expected"""
         # Take first 2 sentences
-        sentences = re.split(r'[.!?]+', text)
-        sentences = [s.strip() for s in sentences if s.strip()]
-        return '. '.join(sentences[:2]) + '.'
+        return '. '.join(_first_n_nonblank(text, 2, _SENT_SPLIT)) + '.'
     
-    def text_to_speech(self, text: str) -> bytes:
+    def text_to_speech(self, text: str, model_id: str = TTS_MODEL_ID, optimize_latency: bool = True) -> bytes:
         """
         Convert text to speech using ElevenLabs
         
         Args:
             text: Text to convert to speech
-            
+            model_id: ElevenLabs model to synthesize with
+            optimize_latency: Trade some quality for lower latency
+        
         Returns:
-            Audio bytes (MP3 format)
+            Audio bytes (MP3 format); empty if text is too short to voice
+        """
+        return b"".join(self.text_to_speech_stream(text, model_id, optimize_latency))
+    
+    def text_to_speech_stream(self, text: str, model_id: str = TTS_MODEL_ID,
+                              optimize_latency: bool = True) -> Iterator[bytes]:
+        """
+        Convert text to speech using ElevenLabs, yielding audio as it arrives
+        
+        Args:
+            text: Text to convert to speech
+            model_id: ElevenLabs model to synthesize with
+            optimize_latency: Trade some quality for lower latency
+        
+        Yields:
+            Audio chunks (MP3 format); nothing if text is too short to voice
         """
         if not self.elevenlabs_client:
             raise ValueError("ElevenLabs API key not configured. Set ELEVENLABS_API_KEY environment variable.")
         
-        try:
-            # Generate audio with professional voice using new API
-            audio_generator = self.elevenlabs_client.text_to_speech.convert(
-                text=text,
-                voice_id="EXAVITQu4vr4xnSDxMaL",  # Rachel voice ID
-                model_id="eleven_monolingual_v1"
-            )
-            
-            # Collect audio bytes
-            audio_bytes = b"".join(audio_generator)
-            return audio_bytes
-            
-        except Exception as e:
-            raise Exception(f"Failed to generate audio: {str(e)}")
+        text = _prepare_tts_text(text)
+        if text is None:
+            return
+        
+        cache_key = _content_hash(text, VOICE_ID, model_id, TTS_OUTPUT_FORMAT)
+        cached = _load_audio(cache_key)
+        if cached is not None:
+            yield cached
+            return
+        
+        # Generate audio with professional voice using new API
+        chunks = []
+        for chunk in self._call_elevenlabs(self._tts_request(text, model_id, optimize_latency)):
+            chunks.append(chunk)
+            yield chunk
+        
+        _store_audio(cache_key, b"".join(chunks))
+    
+    async def text_to_speech_async(self, text: str, model_id: str = TTS_MODEL_ID,
+                                   optimize_latency: bool = True) -> bytes:
+        """
+        Async variant of text_to_speech
+        
+        Args:
+            text: Text to convert to speech
+            model_id: ElevenLabs model to synthesize with
+            optimize_latency: Trade some quality for lower latency
+        
+        Returns:
+            Audio bytes (MP3 format); empty if text is too short to voice
+        """
+        if not self.async_elevenlabs_client:
+            raise ValueError("ElevenLabs API key not configured. Set ELEVENLABS_API_KEY environment variable.")
+        
+        text = _prepare_tts_text(text)
+        if text is None:
+            return b""
+        
+        cache_key = _content_hash(text, VOICE_ID, model_id, TTS_OUTPUT_FORMAT)
+        cached = _load_audio(cache_key)
+        if cached is not None:
+            return cached
+        
+        audio_bytes = await self._call_elevenlabs_async(self._tts_request(text, model_id, optimize_latency))
+        
+        _store_audio(cache_key, audio_bytes)
+        return audio_bytes
+    
+    def _tts_request(self, text: str, model_id: str, optimize_latency: bool) -> Dict:
+        """Keyword arguments for an ElevenLabs text_to_speech.convert call"""
+        return {
+            "text": text,
+            "voice_id": VOICE_ID,
+            "model_id": model_id,
+            "output_format": TTS_OUTPUT_FORMAT,
+            "optimize_streaming_latency": 3 if optimize_latency else None
+        }
     
-    def process_file(self, file_content: str, language: str, filename: str) -> Tuple[str, str, bytes]:
+    @_retry_transient
+    def _call_elevenlabs(self, request: Dict) -> Iterator[bytes]:
+        """
+        Start an ElevenLabs audio stream, retrying transient failures
+        
+        The SDK only sends the request once the stream is iterated, so the first
+        chunk is pulled here where a failure can still be retried.
+        """
+        stream = iter(self.elevenlabs_client.text_to_speech.convert(**request))
+        first_chunk = next(stream, b"")
+        return itertools.chain([first_chunk], stream)
+    
+    @_retry_transient
+    async def _call_elevenlabs_async(self, request: Dict) -> bytes:
+        """Synthesize audio on the shared background loop, retrying transient failures"""
+        return await run_on_loop(self._send_elevenlabs_async(request))
+    
+    async def _send_elevenlabs_async(self, request: Dict) -> bytes:
+        """Synthesize audio with the async ElevenLabs client from the background loop"""
+        chunks = []
+        async with self.get_rate_limiter("elevenlabs", self.elevenlabs_key, ELEVENLABS_QPM):
+            async for chunk in self.async_elevenlabs_client.text_to_speech.convert(**request):
+                chunks.append(chunk)
+        return b"".join(chunks)
+    
+    def process_file(self, file_content: str, language: str, filename: str) -> Tuple[str, str, Optional[bytes]]:
         """
         Complete pipeline: analyze code, generate docs, create TTS
         
@@ -149,14 +709,122 @@ Format your response EXACTLY like this:
             file_content: Code content
             language: Programming language
             filename: Original filename
-            
+        
         Returns:
-            Tuple of (documentation, summary, audio_bytes)
+            Tuple of (documentation, summary, audio_bytes); audio_bytes is None
+            if the summary was too short to voice
         """
         # Generate documentation and summary
         result = self.generate_documentation(file_content, language, filename)
         
         # Generate audio from summary
         audio = self.text_to_speech(result["summary"])
+        if not audio:
+            logger.warning("Summary for %s is too short to voice; skipping audio", filename)
+            audio = None
         
         return result["documentation"], result["summary"], audio
+    
+    def process_file_stream(self, file_content: str, language: str, filename: str) -> Tuple[str, str, Iterator[bytes]]:
+        """
+        Complete pipeline with the audio returned as a stream of chunks
+        
+        Lets the caller start writing audio out before synthesis has finished.
+        
+        Args:
+            file_content: Code content
+            language: Programming language
+            filename: Original filename
+        
+        Returns:
+            Tuple of (documentation, summary, audio_chunks); audio_chunks yields
+            nothing if the summary was too short to voice
+        """
+        result = self.generate_documentation(file_content, language, filename)
+        return result["documentation"], result["summary"], self.text_to_speech_stream(result["summary"])
+    
+    async def process_file_async(self, file_content: str, language: str,
+                                 filename: str) -> Tuple[str, str, Optional[bytes]]:
+        """
+        Async variant of process_file
+        
+        Args:
+            file_content: Code content
+            language: Programming language
+            filename: Original filename
+        
+        Returns:
+            Tuple of (documentation, summary, audio_bytes); audio_bytes is None
+            if the summary was too short to voice
+        """
+        result = await self.generate_documentation_async(file_content, language, filename)
+        audio = await self.text_to_speech_async(result["summary"])
+        if not audio:
+            logger.warning("Summary for %s is too short to voice; skipping audio", filename)
+            audio = None
+        return result["documentation"], result["summary"], audio
+    
+    async def process_files_async(self, items: List[Dict[str, str]], batch_size: int = DEFAULT_BATCH_SIZE,
+                                  concurrency: int = DEFAULT_CONCURRENCY) -> List[Union[Tuple[str, str, Optional[bytes]], Exception]]:
+        """
+        Run the full pipeline over many files concurrently
+        
+        Files are documented in batches of batch_size per Gemini request, batches
+        run concurrently, and the summaries are then voiced concurrently.
+        
+        Args:
+            items: Dicts with 'code_content', 'language' and 'filename' keys
+            batch_size: Files per Gemini request
+            concurrency: Max requests in flight at once (keeps us under provider QPM)
+        
+        Returns:
+            One (documentation, summary, audio_bytes) tuple per item, in order,
+            or the exception raised for that item; audio_bytes is None for
+            summaries too short to voice
+        
+        Raises:
+            ValueError: If batch_size is less than 1
+        """
+        if batch_size < 1:
+            raise ValueError(f"batch_size must be at least 1, got {batch_size}")
+        semaphore = asyncio.Semaphore(concurrency)
+        batches = [items[i:i + batch_size] for i in range(0, len(items), batch_size)]
+        
+        async def run_batch(batch):
+            async with semaphore:
+                return await self.generate_documentation_batch_async(batch)
+        
+        batch_results = await asyncio.gather(*[run_batch(batch) for batch in batches], return_exceptions=True)
+        
+        docs = []
+        for batch, result in zip(batches, batch_results):
+            if isinstance(result, Exception):
+                docs.extend([result] * len(batch))
+            else:
+                docs.extend(result)
+        
+        async def run_tts(doc):
+            if isinstance(doc, Exception):
+                raise doc
+            async with semaphore:
+                audio = await self.text_to_speech_async(doc["summary"])
+            return doc["documentation"], doc["summary"], audio or None
+        
+        return await asyncio.gather(*[run_tts(doc) for doc in docs], return_exceptions=True)
+    
+    def process_files(self, items: List[Dict[str, str]], batch_size: int = DEFAULT_BATCH_SIZE,
+                      concurrency: int = DEFAULT_CONCURRENCY) -> List[Union[Tuple[str, str, Optional[bytes]], Exception]]:
+        """
+        Sync wrapper around process_files_async
+        
+        Args:
+            items: Dicts with 'code_content', 'language' and 'filename' keys
+            batch_size: Files per Gemini request
+            concurrency: Max requests in flight at once
+        
+        Returns:
+            One (documentation, summary, audio_bytes) tuple per item, in order,
+            or the exception raised for that item; audio_bytes is None for
+            summaries too short to voice
+        """
+        return run_sync(self.process_files_async(items, batch_size, concurrency))
@@ -0,0 +1,62 @@
+"""
+Background Event Loop Module
+One long-lived event loop shared by the GitHub and AI clients
+"""
+
+import asyncio
+import threading
+from typing import Any, Callable, Coroutine, Optional, TypeVar
+
+
+T = TypeVar("T")
+
+# Async HTTP and grpc.aio clients are bound to the loop they were first used
+# on, so every async request in the process runs on this one loop
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_loop_lock = threading.Lock()
+
+
+def get_loop() -> asyncio.AbstractEventLoop:
+    """Return the shared background event loop, starting it on first use"""
+    global _loop
+    with _loop_lock:
+        if _loop is None:
+            _loop = asyncio.new_event_loop()
+            threading.Thread(target=_loop.run_forever, name="gitnexus-loop", daemon=True).start()
+    return _loop
+
+
+def run_sync(coro: Coroutine[Any, Any, T]) -> T:
+    """Run a coroutine on the background loop and block until it finishes"""
+    return asyncio.run_coroutine_threadsafe(coro, get_loop()).result()
+
+
+async def run_on_loop(coro: Coroutine[Any, Any, T]) -> T:
+    """
+    Await a coroutine on the background loop from any event loop
+    
+    Callers already on the background loop await it directly; others hand it
+    over and wait without blocking their own loop.
+    """
+    if _on_loop():
+        return await coro
+    return await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(coro, get_loop()))
+
+
+def call_on_loop(fn: Callable[..., T], *args, **kwargs) -> T:
+    """Call a plain function on the background loop's thread and return its result"""
+    if _on_loop():
+        return fn(*args, **kwargs)
+    
+    async def call():
+        return fn(*args, **kwargs)
+    
+    return run_sync(call())
+
+
+def _on_loop() -> bool:
+    """Whether the caller is running on the background loop"""
+    try:
+        return asyncio.get_running_loop() is get_loop()
+    except RuntimeError:
+        return False
@@ -5,102 +5,282 @@ Demonstrates GitHub automation with MCP tool discovery for AI agents
 
 import gradio as gr
 import os
-from ghclient import GitHubClient
-from ai_helper import AIDocumentationGenerator
-from typing import Dict, List
+import hashlib
+import inspect
+import functools
+import threading
+import pathlib
+import tempfile
+import dataclasses
+from collections import deque
+from cachetools import LRUCache, TTLCache
+from ghclient import GitHubClient, GitHubError, IssueInfo, RepoInfo
+from typing import TYPE_CHECKING, Dict, List
+
+if TYPE_CHECKING:
+    from ai_helper import AIDocumentationGenerator
+
+
+# How long read-only GitHub responses are served from memory (seconds)
+LIST_CACHE_TTL = 60
+READ_FILE_CACHE_TTL = 300
+
+# Generated audio summaries live here; only the newest few per session are kept,
+# and only for the most recently active sessions
+SESSION_TMP = os.path.join(tempfile.gettempdir(), "gitnexus-audio")
+AUDIO_FILES_PER_SESSION = 8
+AUDIO_SESSIONS = 64
 
 
 # Initialize GitHub client
+@functools.lru_cache(maxsize=32)
+def _cached_github_client(token: str) -> GitHubClient:
+    """Create one GitHub client (ETag cache and throttle) per token; failures are not cached"""
+    return GitHubClient(token)
+
+
 def get_github_client(token: str = None):
     """Get or create GitHub client instance"""
     try:
-        return GitHubClient(token)
+        return _cached_github_client(token or os.environ.get("GITHUB_TOKEN"))
     except ValueError as e:
         return None
 
 
+# Response cache for read-only handlers
+_response_caches = []
+
+
+def _token_hash(token: str = None) -> str:
+    """Namespace cache entries by the effective GitHub token without storing it"""
+    effective_token = token or os.environ.get("GITHUB_TOKEN") or ""
+    return hashlib.sha1(effective_token.encode()).hexdigest()
+
+
+def ttl_cached(ttl: int):
+    """
+    Cache a read-only handler's successful results for ttl seconds
+    
+    Entries are keyed by handler, arguments and token. Pass no_cache=True to
+    force a fresh read.
+    """
+    def decorator(fn):
+        signature = inspect.signature(fn)
+        cache = TTLCache(maxsize=512, ttl=ttl)
+        lock = threading.Lock()
+        _response_caches.append((cache, lock))
+        
+        @functools.wraps(fn)
+        def wrapper(*args, no_cache: bool = False, **kwargs):
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            arguments = dict(bound.arguments)
+            token = arguments.pop("token", None)
+            key = (fn.__name__, tuple(arguments.items()), _token_hash(token))
+            
+            if not no_cache:
+                with lock:
+                    cached = cache.get(key)
+                if cached is not None:
+                    return cached
+            
+            # Failures raise, so only successful results reach the cache
+            result = fn(*args, **kwargs)
+            with lock:
+                cache[key] = result
+            return result
+        
+        return wrapper
+    return decorator
+
+
+def invalidate_cached_responses(token: str = None, repo_full_name: str = None):
+    """
+    Drop cached reads after a write
+    
+    Args:
+        token: Token the write was made with
+        repo_full_name: Repository that changed, or None for account-level
+            changes (drops cached repository listings)
+    """
+    token_hash = _token_hash(token)
+    for cache, lock in _response_caches:
+        with lock:
+            for key in list(cache.keys()):
+                _, arguments, key_token_hash = key
+                if key_token_hash == token_hash and dict(arguments).get("repo_full_name") == repo_full_name:
+                    cache.pop(key, None)
+
+
+# (token hash, repo, path) -> SHA-256 of the content last committed there
+_last_commits = LRUCache(maxsize=256)
+_last_commits_lock = threading.Lock()
+
+
+def _commit_key(token: str, repo_full_name: str, path: str) -> tuple:
+    """Key for _last_commits"""
+    return _token_hash(token), repo_full_name, path.lstrip("/")
+
+
+def _remember_commit(token: str, repo_full_name: str, path: str, content: str):
+    """Record what was just committed to repo_full_name/path"""
+    with _last_commits_lock:
+        _last_commits[_commit_key(token, repo_full_name, path)] = hashlib.sha256(content.encode()).digest()
+
+
+def unchanged_since_last_commit(token: str, repo_full_name: str, path: str, content: str) -> bool:
+    """Whether content is exactly what this process last committed to repo_full_name/path"""
+    with _last_commits_lock:
+        last = _last_commits.get(_commit_key(token, repo_full_name, path))
+    return last == hashlib.sha256(content.encode()).digest()
+
+
 # MCP Handler Functions
-def mcp_create_repo(name: str, description: str = "", token: str = None) -> Dict:
+GITHUB_NOT_CONFIGURED = "GitHub token not configured"
+
+
+def github_handler(fn):
+    """
+    Turn a function taking the resolved GitHubClient first into an MCP handler
+    
+    The handler keeps the wrapped function's signature minus ``client``, so
+    callers (and ttl_cached) still pass ``token`` as before. Raises GitHubError
+    when no token is configured.
+    """
+    signature = inspect.signature(fn)
+    exposed = signature.replace(parameters=list(signature.parameters.values())[1:])
+    
+    def resolve(args, kwargs):
+        bound = exposed.bind(*args, **kwargs)
+        client = get_github_client(bound.arguments.get("token"))
+        if not client:
+            raise GitHubError(GITHUB_NOT_CONFIGURED)
+        return client, bound
+    
+    if inspect.iscoroutinefunction(fn):
+        @functools.wraps(fn)
+        async def handler(*args, **kwargs):
+            client, bound = resolve(args, kwargs)
+            return await fn(client, *bound.args, **bound.kwargs)
+    else:
+        @functools.wraps(fn)
+        def handler(*args, **kwargs):
+            client, bound = resolve(args, kwargs)
+            return fn(client, *bound.args, **bound.kwargs)
+    
+    handler.__signature__ = exposed
+    return handler
+
+
+@github_handler
+def mcp_create_repo(client: GitHubClient, name: str, description: str = "", token: str = None) -> Dict:
     """MCP handler for creating a GitHub repository (always public)"""
-    client = get_github_client(token)
-    if not client:
-        return {"error": "GitHub token not configured"}
-    return client.create_repo(name, private=False, description=description)
+    result = client.create_repo(name, private=False, description=description)
+    invalidate_cached_responses(token)
+    return result
+
+
+@ttl_cached(LIST_CACHE_TTL)
+@github_handler
+def list_repos(client: GitHubClient, token: str = None) -> List[RepoInfo]:
+    """List repositories, cached as compact RepoInfo records"""
+    return client.list_repos()
 
 
 def mcp_list_repos(token: str = None) -> List[Dict]:
     """MCP handler for listing GitHub repositories"""
-    client = get_github_client(token)
-    if not client:
-        return [{"error": "GitHub token not configured"}]
-    return client.list_repos()
+    return [dataclasses.asdict(repo) for repo in list_repos(token)]
 
 
-def mcp_create_issue(repo_full_name: str, title: str, body: str = "", token: str = None) -> Dict:
+@github_handler
+def mcp_create_issue(client: GitHubClient, repo_full_name: str, title: str, body: str = "", token: str = None) -> Dict:
     """MCP handler for creating a GitHub issue"""
-    client = get_github_client(token)
-    if not client:
-        return {"error": "GitHub token not configured"}
-    return client.create_issue(repo_full_name, title, body)
+    result = client.create_issue(repo_full_name, title, body)
+    invalidate_cached_responses(token, repo_full_name)
+    return result
+
+
+@ttl_cached(LIST_CACHE_TTL)
+@github_handler
+def list_issues(client: GitHubClient, repo_full_name: str, state: str = "open", token: str = None) -> List[IssueInfo]:
+    """List issues, cached as compact IssueInfo records"""
+    return client.list_issues(repo_full_name, state)
 
 
 def mcp_list_issues(repo_full_name: str, state: str = "open", token: str = None) -> List[Dict]:
     """MCP handler for listing GitHub issues"""
-    client = get_github_client(token)
-    if not client:
-        return [{"error": "GitHub token not configured"}]
-    return client.list_issues(repo_full_name, state)
+    return [dataclasses.asdict(issue) for issue in list_issues(repo_full_name, state, token)]
 
 
-def mcp_commit_file(repo_full_name: str, path: str, content: str, message: str, token: str = None) -> Dict:
+@github_handler
+def mcp_commit_file(client: GitHubClient, repo_full_name: str, path: str, content: str, message: str, token: str = None) -> Dict:
     """MCP handler for committing a file to GitHub"""
-    client = get_github_client(token)
-    if not client:
-        return {"error": "GitHub token not configured"}
-    return client.commit_file(repo_full_name, path, content, message)
+    result = client.commit_file(repo_full_name, path, content, message)
+    invalidate_cached_responses(token, repo_full_name)
+    _remember_commit(token, repo_full_name, path, content)
+    return result
+
+
+@github_handler
+def commit_files(client: GitHubClient, repo_full_name: str, files: Dict[str, str], message: str, token: str = None) -> Dict:
+    """Commit several files at once, as a single commit with one branch update"""
+    result = client.commit_files(repo_full_name, files, message)
+    invalidate_cached_responses(token, repo_full_name)
+    for path, content in files.items():
+        _remember_commit(token, repo_full_name, path, content)
+    return result
 
 
-def mcp_read_file(repo_full_name: str, path: str, token: str = None) -> Dict:
+@ttl_cached(READ_FILE_CACHE_TTL)
+@github_handler
+def mcp_read_file(client: GitHubClient, repo_full_name: str, path: str, token: str = None) -> Dict:
     """MCP handler for reading a file from GitHub"""
-    client = get_github_client(token)
-    if not client:
-        return {"error": "GitHub token not configured"}
     return client.read_file(repo_full_name, path)
 
 
 # Initialize AI helper
+@functools.lru_cache(maxsize=32)
+def _cached_ai_helper(gemini_key: str) -> "AIDocumentationGenerator":
+    """Create one AI documentation generator per Gemini key; failures are not cached"""
+    # Imported on first use: google.generativeai and elevenlabs are slow to load
+    # and only the documentation tab needs them
+    from ai_helper import AIDocumentationGenerator
+    return AIDocumentationGenerator(gemini_key)
+
+
 def get_ai_helper(user_gemini_key: str = None):
     """Get or create AI documentation generator instance"""
     try:
-        return AIDocumentationGenerator(user_gemini_key)
+        return _cached_ai_helper(user_gemini_key or os.environ.get("GEMINI_API_KEY"))
     except ValueError as e:
         return None
 
 
 def mcp_generate_docs_with_tts(code_content: str, language: str, filename: str) -> Dict:
-    """MCP handler for generating documentation with TTS"""
+    """
+    MCP handler for generating documentation with TTS
+    
+    Raises ValueError when the AI services aren't configured; AI API errors
+    propagate like the GitHub handlers' GitHubError.
+    """
     ai_helper = get_ai_helper()
     if not ai_helper:
-        return {"error": "AI services not configured. Set GEMINI_API_KEY and ELEVENLABS_API_KEY."}
+        raise ValueError("AI services not configured. Set GEMINI_API_KEY and ELEVENLABS_API_KEY.")
     
-    try:
-        result = ai_helper.generate_documentation(code_content, language, filename)
-        audio = ai_helper.text_to_speech(result["summary"])
-        
-        return {
-            "documentation": result["documentation"],
-            "summary": result["summary"],
-            "audio_generated": True,
-            "filename": f"{filename}_summary.mp3"
-        }
-    except Exception as e:
-        return {"error": str(e)}
+    result = ai_helper.generate_documentation(code_content, language, filename)
+    audio = ai_helper.text_to_speech(result["summary"])
+    
+    return {
+        "documentation": result["documentation"],
+        "summary": result["summary"],
+        "audio_generated": bool(audio),
+        "filename": f"{filename}_summary.mp3"
+    }
 
 
-# MCP Handlers Configuration
-mcp_handlers = {
+# MCP tool schemas (pure data; handlers are bound below)
+MCP_TOOL_SCHEMAS = {
     "github.create_repo": {
-        "handler": mcp_create_repo,
         "description": "Create a new GitHub repository (always public)",
         "parameters": {
             "type": "object",
@@ -119,7 +299,6 @@ mcp_handlers = {
         }
     },
     "github.list_repos": {
-        "handler": mcp_list_repos,
         "description": "List all repositories for the authenticated user",
         "parameters": {
             "type": "object",
@@ -127,7 +306,6 @@ mcp_handlers = {
         }
     },
     "github.create_issue": {
-        "handler": mcp_create_issue,
         "description": "Create an issue in a GitHub repository",
         "parameters": {
             "type": "object",
@@ -150,7 +328,6 @@ mcp_handlers = {
         }
     },
     "github.list_issues": {
-        "handler": mcp_list_issues,
         "description": "List issues in a GitHub repository",
         "parameters": {
             "type": "object",
@@ -170,7 +347,6 @@ mcp_handlers = {
         }
     },
     "github.commit_file": {
-        "handler": mcp_commit_file,
         "description": "Create or update a file in a GitHub repository",
         "parameters": {
             "type": "object",
@@ -196,7 +372,6 @@ mcp_handlers = {
         }
     },
     "github.read_file": {
-        "handler": mcp_read_file,
         "description": "Read a file from a GitHub repository",
         "parameters": {
             "type": "object",
@@ -214,7 +389,6 @@ mcp_handlers = {
         }
     },
     "github.generate_docs_with_tts": {
-        "handler": mcp_generate_docs_with_tts,
         "description": "Generate code documentation and audio summary using AI (Gemini + ElevenLabs)",
         "parameters": {
             "type": "object",
@@ -238,196 +412,288 @@ mcp_handlers = {
 }
 
 
+# MCP tool name -> handler
+MCP_TOOL_HANDLERS = {
+    "github.create_repo": mcp_create_repo,
+    "github.list_repos": mcp_list_repos,
+    "github.create_issue": mcp_create_issue,
+    "github.list_issues": mcp_list_issues,
+    "github.commit_file": mcp_commit_file,
+    "github.read_file": mcp_read_file,
+    "github.generate_docs_with_tts": mcp_generate_docs_with_tts
+}
+
+# MCP Handlers Configuration
+mcp_handlers = {
+    name: {"handler": MCP_TOOL_HANDLERS[name], **schema}
+    for name, schema in MCP_TOOL_SCHEMAS.items()
+}
+
+
 # UI Handler Functions
+_VISIBILITY = ("Public", "Private")
+
+UNCHANGED_SKIPPED = "ℹ️ Unchanged since last commit; skipped."
+
+
+def ui_safe(*extra_outputs):
+    """
+    Report a UI handler's exceptions as an error message instead of raising
+    
+    Args:
+        *extra_outputs: Values for the handler's remaining outputs on error;
+            with none, the handler is assumed to have a single text output
+    """
+    def error_result(e: Exception):
+        message = f"❌ Error: {str(e)}"
+        return (message, *extra_outputs) if extra_outputs else message
+    
+    def decorator(fn):
+        if inspect.iscoroutinefunction(fn):
+            @functools.wraps(fn)
+            async def wrapper(*args, **kwargs):
+                try:
+                    return await fn(*args, **kwargs)
+                except Exception as e:
+                    return error_result(e)
+        else:
+            @functools.wraps(fn)
+            def wrapper(*args, **kwargs):
+                try:
+                    return fn(*args, **kwargs)
+                except Exception as e:
+                    return error_result(e)
+        return wrapper
+    return decorator
+
+
+@ui_safe()
 def ui_create_repo(name: str, description: str, token: str = "") -> str:
     """UI handler for creating a repository"""
-    try:
-        result = mcp_create_repo(name, description, token if token.strip() else None)
-        if "error" in result:
-            return f"❌ Error: {result['error']}"
-        return f"✅ Repository created!\n\n📦 Name: {result['name']}\n🔗 URL: {result['url']}\n📝 Description: {result.get('description', 'N/A')}"
-    except Exception as e:
-        return f"❌ Error: {str(e)}"
+    result = mcp_create_repo(name, description, token if token.strip() else None)
+    return f"✅ Repository created!\n\n📦 Name: {result['name']}\n🔗 URL: {result['url']}\n📝 Description: {result.get('description', 'N/A')}"
 
 
+@ui_safe()
 def ui_list_repos(token: str = "") -> str:
     """UI handler for listing repositories"""
-    try:
-        repos = mcp_list_repos(token if token.strip() else None)
-        if not repos:
-            return "No repositories found."
-        if isinstance(repos, list) and len(repos) > 0 and "error" in repos[0]:
-            return f"❌ Error: {repos[0]['error']}"
-        
-        output = f"📚 Found {len(repos)} repositories:\n\n"
-        for repo in repos:
-            output += f"📦 {repo['name']}\n"
-            output += f"   🔗 {repo['url']}\n"
-            output += f"   🔒 {'Private' if repo['private'] else 'Public'}\n"
-            if repo.get('description'):
-                output += f"   📝 {repo['description']}\n"
-            output += "\n"
-        return output
-    except Exception as e:
-        return f"❌ Error: {str(e)}"
-
-
+    repos = list_repos(token if token.strip() else None)
+    if not repos:
+        return "No repositories found."
+    
+    # Collect pieces and join once; repeated += is quadratic for long lists
+    parts = [f"📚 Found {len(repos)} repositories:\n\n"]
+    append = parts.append
+    for repo in repos:
+        append(f"📦 {repo.name}\n   🔗 {repo.url}\n   🔒 {_VISIBILITY[bool(repo.private)]}\n")
+        description = repo.description
+        if description:
+            append(f"   📝 {description}\n")
+        append("\n")
+    return "".join(parts)
+
+
+@ui_safe()
 def ui_create_issue(repo_full_name: str, title: str, body: str, token: str = "") -> str:
     """UI handler for creating an issue"""
-    try:
-        result = mcp_create_issue(repo_full_name, title, body, token if token.strip() else None)
-        if "error" in result:
-            return f"❌ Error: {result['error']}"
-        return f"✅ Issue created!\n\n🔢 Number: #{result['number']}\n📌 Title: {result['title']}\n🔗 URL: {result['url']}\n📊 State: {result['state']}"
-    except Exception as e:
-        return f"❌ Error: {str(e)}"
+    result = mcp_create_issue(repo_full_name, title, body, token if token.strip() else None)
+    return f"✅ Issue created!\n\n🔢 Number: #{result['number']}\n📌 Title: {result['title']}\n🔗 URL: {result['url']}\n📊 State: {result['state']}"
 
 
+@ui_safe()
 def ui_list_issues(repo_full_name: str, state: str, token: str = "") -> str:
     """UI handler for listing issues"""
-    try:
-        issues = mcp_list_issues(repo_full_name, state, token if token.strip() else None)
-        if not issues:
-            return f"No {state} issues found."
-        if isinstance(issues, list) and len(issues) > 0 and "error" in issues[0]:
-            return f"❌ Error: {issues[0]['error']}"
-        
-        output = f"📋 Found {len(issues)} {state} issues:\n\n"
-        for issue in issues:
-            output += f"🔢 #{issue['number']} - {issue['title']}\n"
-            output += f"   🔗 {issue['url']}\n"
-            output += f"   📊 {issue['state']}\n\n"
-        return output
-    except Exception as e:
-        return f"❌ Error: {str(e)}"
+    issues = list_issues(repo_full_name, state, token if token.strip() else None)
+    if not issues:
+        return f"No {state} issues found."
+    
+    parts = [f"📋 Found {len(issues)} {state} issues:\n\n"]
+    parts.extend(
+        f"🔢 #{issue.number} - {issue.title}\n"
+        f"   🔗 {issue.url}\n"
+        f"   📊 {issue.state}\n\n"
+        for issue in issues
+    )
+    return "".join(parts)
 
 
+@ui_safe()
 def ui_commit_file(repo_full_name: str, path: str, content: str, message: str, token: str = "") -> str:
     """UI handler for committing a file"""
-    try:
-        result = mcp_commit_file(repo_full_name, path, content, message, token if token.strip() else None)
-        if "error" in result:
-            return f"❌ Error: {result['error']}"
-        return f"✅ File {result['action']}!\n\n📄 Path: {result['path']}\n🔗 URL: {result['url']}\n📝 Commit: {result['commit_sha'][:7]}\n⚡ Action: {result['action'].upper()}"
-    except Exception as e:
-        return f"❌ Error: {str(e)}"
+    result = mcp_commit_file(repo_full_name, path, content, message, token if token.strip() else None)
+    return f"✅ File {result['action']}!\n\n📄 Path: {result['path']}\n🔗 URL: {result['url']}\n📝 Commit: {result['commit_sha'][:7]}\n⚡ Action: {result['action'].upper()}"
 
 
+@ui_safe("")
 def ui_read_file(repo_full_name: str, path: str, token: str = "") -> tuple:
     """UI handler for reading a file"""
+    result = mcp_read_file(repo_full_name, path, token if token.strip() else None)
+    
+    info = f"✅ File read successfully!\n\n📄 Path: {result['path']}\n🔗 URL: {result['url']}\n📊 Size: {result['size']} bytes"
+    return info, result['content']
+
+
+# session hash -> paths of that session's audio files, oldest first; sessions
+# are ordered least recently active first
+_session_audio_files: Dict[str, deque] = {}
+_session_audio_lock = threading.Lock()
+
+
+def _track_audio_file(session: str, audio_path: str):
+    """Remember a session's audio file, deleting the oldest files and sessions once over the limits"""
+    with _session_audio_lock:
+        paths = _session_audio_files.pop(session, None) or deque()
+        _session_audio_files[session] = paths
+        paths.append(audio_path)
+        evicted = [paths.popleft() for _ in range(len(paths) - AUDIO_FILES_PER_SESSION)]
+        while len(_session_audio_files) > AUDIO_SESSIONS:
+            evicted.extend(_session_audio_files.pop(next(iter(_session_audio_files))))
+    _delete_audio_files(evicted)
+
+
+def _forget_session_audio(request: gr.Request):
+    """Delete a session's audio files once its browser tab is closed"""
+    with _session_audio_lock:
+        paths = _session_audio_files.pop(getattr(request, "session_hash", None) or "", ())
+    _delete_audio_files(paths)
+
+
+def _delete_audio_files(paths):
+    """Delete audio files, ignoring any that are already gone"""
+    for path in paths:
+        try:
+            os.unlink(path)
+        except FileNotFoundError:
+            pass
+
+
+def ui_load_code_file(file) -> tuple:
+    """
+    Read an uploaded code file once so the docs and commit handlers can share it
+    
+    Returns:
+        Tuple of (code content, filename); content is None if the file
+        couldn't be read as UTF-8 text, both are None without a file
+    """
+    if file is None or not hasattr(file, 'name'):
+        return None, None
+    filename = os.path.basename(file.name)
     try:
-        result = mcp_read_file(repo_full_name, path, token if token.strip() else None)
-        if "error" in result:
-            return f"❌ Error: {result['error']}", ""
-        
-        info = f"✅ File read successfully!\n\n📄 Path: {result['path']}\n🔗 URL: {result['url']}\n📊 Size: {result['size']} bytes"
-        return info, result['content']
-    except Exception as e:
-        return f"❌ Error: {str(e)}", ""
+        return pathlib.Path(file.name).read_text(encoding='utf-8'), filename
+    except (OSError, UnicodeDecodeError):
+        return None, filename
 
 
-def ui_generate_docs(file, language: str, user_key: str = "") -> tuple:
+@ui_safe("", None)
+def ui_generate_docs(code_content: str, filename: str, language: str, user_key: str = "", request: gr.Request = None) -> tuple:
     """UI handler for AI documentation generation with TTS"""
+    if filename is None:
+        return "❌ Please upload a file", "", None
+    if code_content is None:
+        return "❌ Invalid file upload", "", None
+    
+    # Generate documentation and TTS
+    # Use user key if provided, otherwise fallback to env var
+    ai_helper = get_ai_helper(user_key if user_key.strip() else None)
+    if not ai_helper or not ai_helper.gemini_model:
+        return "❌ AI services not configured. Please set GEMINI_API_KEY (env) or provide your own key.", "", None
+    
+    docs, summary, audio_chunks = ai_helper.process_file_stream(code_content, language, filename)
+    
+    # Stream audio to temporary file for Gradio as it is synthesized
+    os.makedirs(SESSION_TMP, exist_ok=True)
+    fd, audio_path = tempfile.mkstemp(suffix='.mp3', dir=SESSION_TMP)
     try:
-        if file is None:
-            return "❌ Please upload a file", "", None
-        
-        # Read uploaded file
-        if hasattr(file, 'name'):
-            filename = os.path.basename(file.name)
-            with open(file.name, 'r', encoding='utf-8') as f:
-                code_content = f.read()
-        else:
-            return "❌ Invalid file upload", "", None
-        
-        # Generate documentation and TTS
-        # Use user key if provided, otherwise fallback to env var
-        ai_helper = get_ai_helper(user_key if user_key.strip() else None)
-        if not ai_helper or not ai_helper.gemini_model:
-            return "❌ AI services not configured. Please set GEMINI_API_KEY (env) or provide your own key.", "", None
-        
-        docs, summary, audio = ai_helper.process_file(code_content, language, filename)
-        
-        # Save audio to temporary file for Gradio
-        import tempfile
-        audio_path = tempfile.NamedTemporaryFile(delete=False, suffix='.mp3').name
-        with open(audio_path, 'wb') as f:
-            f.write(audio)
-        
-        return docs, summary, audio_path
-        
-    except Exception as e:
-        return f"❌ Error: {str(e)}", "", None
+        with os.fdopen(fd, 'wb') as f:
+            bytes_written = sum(f.write(chunk) for chunk in audio_chunks)
+    except BaseException:
+        os.unlink(audio_path)
+        raise
+    
+    # No audio when the summary was too short to voice
+    if not bytes_written:
+        os.unlink(audio_path)
+        audio_path = None
+    else:
+        _track_audio_file(getattr(request, "session_hash", None) or "", audio_path)
+    
+    return docs, summary, audio_path
 
 
+@ui_safe()
 def ui_commit_docs(repo_full_name: str, path: str, documentation: str, token: str = "") -> str:
     """UI handler for committing generated documentation"""
-    try:
-        if not documentation or documentation.startswith("❌"):
-            return "❌ No documentation to commit. Generate documentation first."
-        
-        result = mcp_commit_file(repo_full_name, path, documentation, "Add AI-generated documentation", token if token.strip() else None)
-        if "error" in result:
-            return f"❌ Error: {result['error']}"
-        return f"✅ Documentation committed!\n\n📄 Path: {result['path']}\n🔗 URL: {result['url']}\n📝 Commit: {result['commit_sha'][:7]}"
-    except Exception as e:
-        return f"❌ Error: {str(e)}"
+    if not documentation or documentation.startswith("❌"):
+        return "❌ No documentation to commit. Generate documentation first."
+    
+    token_val = token if token.strip() else None
+    if unchanged_since_last_commit(token_val, repo_full_name, path, documentation):
+        return UNCHANGED_SKIPPED
+    
+    result = mcp_commit_file(repo_full_name, path, documentation, "Add AI-generated documentation", token_val)
+    return f"✅ Documentation committed!\n\n📄 Path: {result['path']}\n🔗 URL: {result['url']}\n📝 Commit: {result['commit_sha'][:7]}"
 
 
-def ui_commit_code_file(file, repo_full_name: str, path: str, token: str = "") -> str:
+@ui_safe()
+def ui_commit_code_file(code_content: str, filename: str, repo_full_name: str, path: str, token: str = "") -> str:
     """UI handler for committing the uploaded code file"""
-    try:
-        if file is None:
-            return "❌ No file uploaded. Please upload a code file first."
-        
-        # Read uploaded file
-        if hasattr(file, 'name'):
-            with open(file.name, 'r', encoding='utf-8') as f:
-                code_content = f.read()
-        else:
-            return "❌ Invalid file upload"
-        
-        result = mcp_commit_file(repo_full_name, path, code_content, f"Add {os.path.basename(file.name)}", token if token.strip() else None)
-        if "error" in result:
-            return f"❌ Error: {result['error']}"
-        return f"✅ Code file committed!\n\n📄 Path: {result['path']}\n🔗 URL: {result['url']}\n📝 Commit: {result['commit_sha'][:7]}"
-    except Exception as e:
-        return f"❌ Error: {str(e)}"
+    if filename is None:
+        return "❌ No file uploaded. Please upload a code file first."
+    if code_content is None:
+        return "❌ Invalid file upload"
+    
+    token_val = token if token.strip() else None
+    if unchanged_since_last_commit(token_val, repo_full_name, path, code_content):
+        return UNCHANGED_SKIPPED
+    
+    result = mcp_commit_file(repo_full_name, path, code_content, f"Add {filename}", token_val)
+    return f"✅ Code file committed!\n\n📄 Path: {result['path']}\n🔗 URL: {result['url']}\n📝 Commit: {result['commit_sha'][:7]}"
 
 
-def ui_commit_both(file, repo_full_name: str, code_path: str, docs_path: str, documentation: str, token: str = "") -> str:
+@ui_safe()
+def ui_commit_both(code_content: str, filename: str, repo_full_name: str, code_path: str, docs_path: str, documentation: str, token: str = "") -> str:
     """UI handler for committing both code file and documentation"""
-    try:
-        results = []
-        token_val = token if token.strip() else None
-        
-        # Commit code file
-        if file is not None:
-            if hasattr(file, 'name'):
-                with open(file.name, 'r', encoding='utf-8') as f:
-                    code_content = f.read()
-                
-                result = mcp_commit_file(repo_full_name, code_path, code_content, f"Add {os.path.basename(file.name)}", token_val)
-                if "error" in result:
-                    results.append(f"❌ Code file error: {result['error']}")
-                else:
-                    results.append(f"✅ Code file committed: {result['url']}")
+    results = [None, None]
+    token_val = token if token.strip() else None
+    files = {}
+    
+    # Commit code file
+    if filename is None:
+        results[0] = "⚠️ No code file uploaded, skipping"
+    elif code_content is not None:
+        if unchanged_since_last_commit(token_val, repo_full_name, code_path, code_content):
+            results[0] = "ℹ️ Code file unchanged since last commit, skipping"
         else:
-            results.append("⚠️ No code file uploaded, skipping")
-        
-        # Commit documentation
-        if documentation and not documentation.startswith("❌"):
-            result = mcp_commit_file(repo_full_name, docs_path, documentation, "Add AI-generated documentation", token_val)
-            if "error" in result:
-                results.append(f"❌ Documentation error: {result['error']}")
-            else:
-                results.append(f"✅ Documentation committed: {result['url']}")
+            files[0] = ("Code file", code_path, code_content)
+    else:
+        results[0] = "❌ Invalid file upload"
+    
+    # Commit documentation
+    if not documentation or documentation.startswith("❌"):
+        results[1] = "⚠️ No documentation generated, skipping"
+    elif unchanged_since_last_commit(token_val, repo_full_name, docs_path, documentation):
+        results[1] = "ℹ️ Documentation unchanged since last commit, skipping"
+    else:
+        files[1] = ("Documentation", docs_path, documentation)
+    
+    # Both files go out in one commit, so there's a single update of the branch
+    if files:
+        if 0 not in files:
+            message = "Add AI-generated documentation"
+        elif 1 not in files:
+            message = f"Add {filename}"
         else:
-            results.append("⚠️ No documentation generated, skipping")
-        
-        return "\n\n".join(results)
-    except Exception as e:
-        return f"❌ Error: {str(e)}"
+            message = f"Add {filename} and its documentation"
+        try:
+            result = commit_files(repo_full_name, {path: content for _, path, content in files.values()}, message, token_val)
+        except Exception as e:
+            for index, (label, _, _) in files.items():
+                results[index] = f"❌ {label} error: {str(e)}"
+        else:
+            for index, (label, _, _) in files.items():
+                results[index] = f"✅ {label} committed: {result['url']}"
+    
+    return "\n\n".join(r for r in results if r)
 
 
 # Build Gradio UI
@@ -542,6 +808,9 @@ def build_ui():
                         label="📁 Upload Code File",
                         file_types=[".py", ".js", ".java", ".cpp", ".go", ".rs", ".ts", ".jsx", ".tsx", ".c", ".h"]
                     )
+                    # Contents and name of the uploaded file, read once on upload
+                    code_state = gr.State(None)
+                    filename_state = gr.State(None)
                     with gr.Column():
                         language_select = gr.Dropdown(
                             choices=["python", "javascript", "java", "cpp", "go", "rust", "typescript", "c"],
@@ -579,15 +848,25 @@ def build_ui():
                 commit_output = gr.Textbox(label="Result", lines=6)
                 
                 # Event handlers
+                file_upload.upload(
+                    ui_load_code_file,
+                    inputs=file_upload,
+                    outputs=[code_state, filename_state]
+                )
+                file_upload.clear(
+                    lambda: (None, None),
+                    outputs=[code_state, filename_state]
+                )
+                
                 generate_btn.click(
                     ui_generate_docs,
-                    inputs=[file_upload, language_select, user_gemini_key],
+                    inputs=[code_state, filename_state, language_select, user_gemini_key],
                     outputs=[docs_output, summary_output, audio_output]
                 )
                 
                 commit_code_btn.click(
                     ui_commit_code_file,
-                    inputs=[file_upload, commit_repo, commit_code_path, user_github_token],
+                    inputs=[code_state, filename_state, commit_repo, commit_code_path, user_github_token],
                     outputs=commit_output
                 )
                 
@@ -599,7 +878,7 @@ def build_ui():
                 
                 commit_both_btn.click(
                     ui_commit_both,
-                    inputs=[file_upload, commit_repo, commit_code_path, commit_docs_path, docs_output, user_github_token],
+                    inputs=[code_state, filename_state, commit_repo, commit_code_path, commit_docs_path, docs_output, user_github_token],
                     outputs=commit_output
                 )
         
@@ -608,6 +887,8 @@ def build_ui():
         ---
         💡 All repositories are created as **public**.
         """)
+        
+        demo.unload(_forget_session_audio)
     
     return demo
 
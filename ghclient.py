@@ -1,31 +1,350 @@
 """
 GitHub Client Module
-Handles all GitHub API interactions using PyGithub
+Handles all GitHub API interactions over the GitHub REST API (async httpx)
 """
 
 import os
-from github import Github, GithubException
-from typing import Dict, List, Optional
+import re
+import time
+import random
+import asyncio
+import base64
+import itertools
+import threading
+from collections import deque
+from dataclasses import dataclass
+import urllib.parse
+import httpx
+import orjson
+from cachetools import LRUCache
+from aioloop import run_on_loop, run_sync
+from importlib.util import find_spec
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterable, List, Mapping, Optional, Tuple, TypeVar
 
 
-class GitHubClient:
-    """GitHub API client wrapper for automation tasks"""
+# REST API root (override for GitHub Enterprise)
+GITHUB_API_URL = os.environ.get("GITHUB_API_URL", "https://api.github.com").rstrip("/")
+
+# GraphQL endpoint; GitHub Enterprise serves it at /api/graphql beside /api/v3
+GITHUB_GRAPHQL_URL = os.environ.get(
+    "GITHUB_GRAPHQL_URL",
+    GITHUB_API_URL[:-len("/v3")] + "/graphql" if GITHUB_API_URL.endswith("/api/v3") else GITHUB_API_URL + "/graphql"
+)
+
+# Connection limits of the shared HTTP client
+GITHUB_MAX_CONNECTIONS = 100
+GITHUB_POOL_SIZE = 20
+
+# Multiplex requests over one HTTP/2 connection when httpx's optional h2
+# dependency is installed (httpx[http2]); plain httpx falls back to HTTP/1.1
+HTTP2_ENABLED = find_spec("h2") is not None
+
+# Max GET responses remembered per client
+RESPONSE_CACHE_SIZE = 1024
+
+# Seconds a GET response is served without asking GitHub again (default)
+RESPONSE_CACHE_TTL = 60
+
+# Items requested per page when listing
+PER_PAGE = 100
+
+# Pages fetched at once when a listing spans several pages
+PAGE_CONCURRENCY = 20
+
+# Default calls in flight for map_concurrent
+MAP_CONCURRENCY = 32
+
+# Only the fields RepoInfo needs, instead of the ~100 of a REST repository;
+# affiliations match GET /user/repos
+_REPOS_QUERY = """
+query($first: Int!, $cursor: String) {
+  viewer {
+    repositories(first: $first, after: $cursor, ownerAffiliations: [OWNER, COLLABORATOR, ORGANIZATION_MEMBER]) {
+      pageInfo { hasNextPage endCursor }
+      nodes { name url isPrivate description }
+    }
+  }
+}
+"""
+
+_NEXT_LINK_RE = re.compile(r'<([^>]+)>;\s*rel="next"')
+_LAST_LINK_RE = re.compile(r'<([^>]+)>;\s*rel="last"')
+_MAX_AGE_RE = re.compile(r'max-age=(\d+)')
+
+# "owner/repo" with the characters GitHub allows in either part (e.g. "org/.github"),
+# but never "." or ".." alone, which would climb out of the /repos/ path
+_REPO_NAME_RE = re.compile(r'(?!\.\.?/)[A-Za-z0-9_.-]+/(?!\.\.?$)[A-Za-z0-9_.-]+')
+_INVALID_REPO_MSG = "Invalid repository name. Must be in format 'username/repo'"
+
+
+class GitHubError(Exception):
+    """A GitHub request failed or the client isn't configured"""
     
-    def __init__(self, token: Optional[str] = None):
+    def __init__(self, message: str, status: Optional[int] = None):
+        super().__init__(message)
+        self.status = status
+
+
+class GitHubNotFoundError(GitHubError):
+    """The repository, file or other resource doesn't exist (HTTP 404)"""
+
+
+class GitHubRateLimitError(GitHubError):
+    """GitHub still refused the request for rate limiting after backing off"""
+    
+    def __init__(self, message: str, status: Optional[int] = None, retry_after: Optional[float] = None):
+        super().__init__(message, status)
+        # Seconds until GitHub says to try again, if it said
+        self.retry_after = retry_after
+
+
+class GitHubServerError(GitHubError):
+    """GitHub failed on its side (HTTP 5xx); usually worth retrying later"""
+
+
+@dataclass(slots=True)
+class RepoInfo:
+    """A repository as returned by list_repos (use dataclasses.asdict for a dict)"""
+    name: str
+    url: str
+    private: bool
+    description: str
+
+
+@dataclass(slots=True)
+class IssueInfo:
+    """An issue as returned by list_issues (use dataclasses.asdict for a dict)"""
+    number: int
+    title: str
+    url: str
+    state: str
+
+
+# Ceiling for outbound GitHub requests per second, per token
+MAX_REQUESTS_PER_SECOND = 10
+
+# Longest Retry-After we will sleep through before giving up (seconds)
+MAX_RETRY_AFTER = 60
+
+# Times a request is re-queued after hitting a rate limit
+RATE_LIMIT_RETRIES = 5
+
+# First backoff (seconds, doubled per retry) when a rate-limit reply says
+# nothing about how long to wait
+RATE_LIMIT_BACKOFF = 1.0
+
+# Requests in flight at once across the process (GitHub's secondary limits
+# forbid more than 100 concurrent requests)
+MAX_CONCURRENT_REQUESTS = 50
+
+
+class GitHubThrottle:
+    """
+    Token bucket that paces requests to GitHub's remaining quota
+    
+    The refill rate follows X-RateLimit-Remaining / seconds until
+    X-RateLimit-Reset (capped at MAX_REQUESTS_PER_SECOND); an exhausted quota,
+    a Retry-After reply or a backoff blocks the bucket until it may be used
+    again, so concurrent requests wait too instead of piling onto the limit.
+    """
+    
+    def __init__(self, max_rate: float = MAX_REQUESTS_PER_SECOND):
+        self.max_rate = max_rate
+        self.rate = max_rate
+        self.tokens = max_rate
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0
+        self._lock = threading.Lock()
+    
+    def _reserve(self) -> float:
+        """Take a token and return how long the caller must wait before using it"""
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.max_rate, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            
+            # Tokens may go negative: each waiter reserves its own slot
+            self.tokens -= 1
+            delay = -self.tokens / self.rate if self.tokens < 0 else 0.0
+            delay = max(delay, self.blocked_until - now)
+            if delay > MAX_RETRY_AFTER:
+                # The caller won't wait this long, so give the slot back
+                self.tokens += 1
+            return delay
+    
+    async def acquire(self):
+        """
+        Wait (without blocking the event loop) until a request may be sent
+        
+        Raises:
+            GitHubRateLimitError: If that would take longer than MAX_RETRY_AFTER
+        """
+        delay = self._reserve()
+        if delay > MAX_RETRY_AFTER:
+            raise GitHubRateLimitError(f"GitHub rate limit exceeded; retry in {delay:.0f}s", retry_after=delay)
+        if delay > 0:
+            await asyncio.sleep(delay)
+    
+    def update(self, status: int, headers: Mapping[str, str]) -> Optional[float]:
+        """
+        Adjust the bucket from a response's rate-limit headers
+        
+        Args:
+            status: HTTP status code
+            headers: Response headers (lowercase keys or case-insensitive mapping)
+            
+        Returns:
+            Seconds the headers say to wait before retrying a rate-limited
+            request, or None if they don't say
+        """
+        now_wall = time.time()
+        now = time.monotonic()
+        remaining = headers.get("x-ratelimit-remaining")
+        reset = headers.get("x-ratelimit-reset")
+        retry_after = headers.get("retry-after")
+        
+        with self._lock:
+            if remaining is not None and reset is not None:
+                remaining, seconds_to_reset = int(remaining), max(float(reset) - now_wall, 1.0)
+                if remaining > 0:
+                    self.rate = min(self.max_rate, remaining / seconds_to_reset)
+                else:
+                    self.blocked_until = max(self.blocked_until, now + seconds_to_reset)
+            
+            if status in (403, 429):
+                if retry_after is not None:
+                    self.blocked_until = max(self.blocked_until, now + float(retry_after))
+                    return float(retry_after)
+                if remaining == 0:
+                    return seconds_to_reset
+        return None
+    
+    def block(self, seconds: float):
+        """Hold every request back for the given number of seconds"""
+        with self._lock:
+            self.blocked_until = max(self.blocked_until, time.monotonic() + seconds)
+
+
+# The one async HTTP/2 client (and connection pool) for the whole process.
+# httpx connections are bound to the loop they were opened on, so it lives on
+# the background loop and requests from other loops are handed over to it.
+_async_http: Optional[httpx.AsyncClient] = None
+_async_http_lock = threading.Lock()
+
+# Caps requests in flight (created on, and only used from, the background loop)
+_request_slots: Optional[asyncio.Semaphore] = None
+
+
+def get_async_http() -> httpx.AsyncClient:
+    """Return the process-wide async HTTP client, creating it on first use"""
+    global _async_http
+    with _async_http_lock:
+        if _async_http is None:
+            _async_http = httpx.AsyncClient(
+                base_url=GITHUB_API_URL,
+                http2=HTTP2_ENABLED,
+                limits=httpx.Limits(max_connections=GITHUB_MAX_CONNECTIONS, max_keepalive_connections=GITHUB_POOL_SIZE),
+                timeout=30.0
+            )
+    return _async_http
+
+
+async def _send(method: str, url: str, **kwargs) -> httpx.Response:
+    """Send one request over the shared HTTP client on the background loop"""
+    return await run_on_loop(_send_limited(method, url, **kwargs))
+
+
+async def _send_limited(method: str, url: str, **kwargs) -> httpx.Response:
+    """Send a request from the background loop, at most MAX_CONCURRENT_REQUESTS at once"""
+    global _request_slots
+    if _request_slots is None:
+        _request_slots = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+    async with _request_slots:
+        return await get_async_http().request(method, url, **kwargs)
+
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+async def map_concurrent(items: Iterable[T], fn: Callable[[T], Awaitable[R]], limit: int = MAP_CONCURRENCY) -> List[R]:
+    """
+    Await fn(item) for every item, at most limit at a time
+    
+    Meant for per-item follow-up calls (e.g. one request per repository)
+    that would otherwise run one after another. The first failure cancels
+    the calls still running and is raised as is.
+    
+    Args:
+        items: Inputs to map over
+        fn: Async function applied to each item
+        limit: Max calls in flight
+        
+    Returns:
+        fn's results, in the order of items
+    """
+    semaphore = asyncio.Semaphore(limit)
+    
+    async def run(item: T) -> R:
+        async with semaphore:
+            return await fn(item)
+    
+    tasks = [asyncio.ensure_future(run(item)) for item in items]
+    try:
+        return await asyncio.gather(*tasks)
+    except BaseException:
+        # gather leaves the other calls running; stop them and let them unwind
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+
+
+class AsyncGitHubClient:
+    """
+    Async GitHub API client for automation tasks
+    
+    Requests go through the process-wide httpx.AsyncClient, so independent
+    calls can be gathered and share one pooled HTTP/2 connection whichever
+    event loop they are awaited from.
+    """
+    
+    def __init__(self, token: Optional[str] = None, cache_ttl: int = RESPONSE_CACHE_TTL, use_etag: bool = True):
         """
         Initialize GitHub client with access token
         
         Args:
             token: GitHub Personal Access Token (if None, reads from GITHUB_TOKEN env var)
+            cache_ttl: Seconds a GET response is reused without a request (0 disables)
+            use_etag: Revalidate stale responses with If-None-Match
         """
         self.token = token or os.environ.get("GITHUB_TOKEN")
         if not self.token:
             raise ValueError("GitHub token not provided. Set GITHUB_TOKEN environment variable.")
         
-        self.github = Github(self.token)
-        self.user = self.github.get_user()
+        self.headers = {
+            "Authorization": f"Bearer {self.token}",
+            "Accept": "application/vnd.github+json",
+            "X-GitHub-Api-Version": "2022-11-28"
+        }
+        
+        # Paces every request made with this token
+        self.throttle = GitHubThrottle()
+        
+        # (url, params) -> (etag, expires_at, headers, parsed body) for GETs
+        self.cache_ttl = cache_ttl
+        self.use_etag = use_etag
+        self._response_cache = LRUCache(maxsize=RESPONSE_CACHE_SIZE)
+        self._cache_lock = threading.Lock()
+        
+        # contents URL -> last known blob sha, used to PUT updates without a GET
+        # (guarded by _cache_lock too: the client is used from several threads)
+        self._content_shas = LRUCache(maxsize=RESPONSE_CACHE_SIZE)
+        
+        # repo full name -> default branch, looked up the first time it's needed
+        self._default_branches = LRUCache(maxsize=RESPONSE_CACHE_SIZE)
     
-    def create_repo(self, name: str, private: bool = False, description: str = "") -> Dict:
+    async def create_repo(self, name: str, private: bool = False, description: str = "") -> Dict:
         """
         Create a new GitHub repository
         
@@ -38,43 +357,66 @@ class GitHubClient:
             Dict with keys: name, url, private
         """
         try:
-            repo = self.user.create_repo(
-                name=name,
-                private=private,
-                description=description,
-                auto_init=True  # Initialize with README
-            )
+            response = await self._request("POST", "/user/repos", json={
+                "name": name,
+                "private": private,
+                "description": description,
+                "auto_init": True  # Initialize with README
+            })
+            response.raise_for_status()
+            repo = orjson.loads(response.content)
             return {
-                "name": repo.name,
-                "url": repo.html_url,
-                "private": repo.private,
-                "description": repo.description
+                "name": repo["name"],
+                "url": repo["html_url"],
+                "private": repo["private"],
+                "description": repo["description"]
             }
-        except GithubException as e:
-            raise Exception(f"Failed to create repository: {e.data.get('message', str(e))}")
+        except httpx.HTTPStatusError as e:
+            raise self._http_error("Failed to create repository", e.response)
     
-    def list_repos(self) -> List[Dict]:
+    async def list_repos(self) -> List[RepoInfo]:
         """
         List all repositories for the authenticated user
         
         Returns:
-            List of dicts with keys: name, url, private
+            List of RepoInfo (name, url, private, description)
         """
         try:
-            repos = self.user.get_repos()
-            return [
-                {
-                    "name": repo.name,
-                    "url": repo.html_url,
-                    "private": repo.private,
-                    "description": repo.description or ""
-                }
-                for repo in repos
-            ]
-        except GithubException as e:
-            raise Exception(f"Failed to list repositories: {e.data.get('message', str(e))}")
+            repos = []
+            cursor = None
+            while True:
+                data = await self._graphql(_REPOS_QUERY, {"first": PER_PAGE, "cursor": cursor}, "Failed to list repositories")
+                connection = data["viewer"]["repositories"]
+                repos.extend(
+                    RepoInfo(node["name"], node["url"], node["isPrivate"], node["description"] or "")
+                    for node in connection["nodes"]
+                )
+                if not connection["pageInfo"]["hasNextPage"]:
+                    return repos
+                cursor = connection["pageInfo"]["endCursor"]
+        except httpx.HTTPStatusError as e:
+            raise self._http_error("Failed to list repositories", e.response)
     
-    def create_issue(self, repo_full_name: str, title: str, body: str = "") -> Dict:
+    async def iter_repos(self, prefetch: int = 1) -> AsyncIterator[RepoInfo]:
+        """
+        Lazily yield the authenticated user's repositories, page by page
+        
+        Stops fetching as soon as the caller stops iterating.
+        
+        Args:
+            prefetch: Pages requested ahead while the caller consumes the current one
+            
+        Yields:
+            RepoInfo for each repository
+        """
+        try:
+            async for page in self.iter_pages("/user/repos", prefetch=prefetch):
+                for repo in page:
+                    yield self._repo_info(repo)
+        except httpx.HTTPStatusError as e:
+            raise self._http_error("Failed to list repositories", e.response)
+    
+    async def create_issue(self, repo_full_name: str, title: str, body: str = "") -> Dict:
         """
         Create an issue in a repository
         
@@ -88,18 +430,19 @@ class GitHubClient:
         """
         try:
             self._validate_repo_name(repo_full_name)
-            repo = self.github.get_repo(repo_full_name)
-            issue = repo.create_issue(title=title, body=body)
+            response = await self._request("POST", f"/repos/{repo_full_name}/issues", json={"title": title, "body": body})
+            response.raise_for_status()
+            issue = orjson.loads(response.content)
             return {
-                "number": issue.number,
-                "url": issue.html_url,
-                "title": issue.title,
-                "state": issue.state
+                "number": issue["number"],
+                "url": issue["html_url"],
+                "title": issue["title"],
+                "state": issue["state"]
             }
-        except GithubException as e:
-            raise Exception(f"Failed to create issue: {e.data.get('message', str(e))}")
+        except httpx.HTTPStatusError as e:
+            raise self._http_error("Failed to create issue", e.response)
     
-    def list_issues(self, repo_full_name: str, state: str = "open") -> List[Dict]:
+    async def list_issues(self, repo_full_name: str, state: str = "open") -> List[IssueInfo]:
         """
         List issues in a repository
         
@@ -108,25 +451,38 @@ class GitHubClient:
             state: Issue state filter ("open", "closed", or "all")
             
         Returns:
-            List of dicts with keys: number, title, url, state
+            List of IssueInfo (number, title, url, state)
         """
         try:
             self._validate_repo_name(repo_full_name)
-            repo = self.github.get_repo(repo_full_name)
-            issues = repo.get_issues(state=state)
-            return [
-                {
-                    "number": issue.number,
-                    "title": issue.title,
-                    "url": issue.html_url,
-                    "state": issue.state
-                }
-                for issue in issues
-            ]
-        except GithubException as e:
-            raise Exception(f"Failed to list issues: {e.data.get('message', str(e))}")
+            issues = itertools.chain.from_iterable(await self.paginate(f"/repos/{repo_full_name}/issues", {"state": state}))
+            return [self._issue_info(issue) for issue in issues]
+        except httpx.HTTPStatusError as e:
+            raise self._http_error("Failed to list issues", e.response)
     
-    def commit_file(self, repo_full_name: str, path: str, content: str, message: str) -> Dict:
+    async def iter_issues(self, repo_full_name: str, state: str = "open", prefetch: int = 1) -> AsyncIterator[IssueInfo]:
+        """
+        Lazily yield a repository's issues, page by page
+        
+        Stops fetching as soon as the caller stops iterating.
+        
+        Args:
+            repo_full_name: Full repository name (e.g., "username/repo")
+            state: Issue state filter ("open", "closed", or "all")
+            prefetch: Pages requested ahead while the caller consumes the current one
+            
+        Yields:
+            IssueInfo for each issue
+        """
+        self._validate_repo_name(repo_full_name)
+        try:
+            async for page in self.iter_pages(f"/repos/{repo_full_name}/issues", {"state": state}, prefetch):
+                for issue in page:
+                    yield self._issue_info(issue)
+        except httpx.HTTPStatusError as e:
+            raise self._http_error("Failed to list issues", e.response)
+    
+    async def commit_file(self, repo_full_name: str, path: str, content: str, message: str) -> Dict:
         """
         Create or update a file in a repository
         
@@ -141,41 +497,116 @@ class GitHubClient:
         """
         try:
             self._validate_repo_name(repo_full_name)
-            repo = self.github.get_repo(repo_full_name)
-            
-            # Check if file exists
-            try:
-                existing_file = repo.get_contents(path)
-                # File exists, update it
-                result = repo.update_file(
-                    path=path,
-                    message=message,
-                    content=content,
-                    sha=existing_file.sha
-                )
-                action = "updated"
-            except GithubException as e:
-                if e.status == 404:
-                    # File doesn't exist, create it
-                    result = repo.create_file(
-                        path=path,
-                        message=message,
-                        content=content
-                    )
-                    action = "created"
-                else:
-                    raise
+            url = self._contents_url(repo_full_name, path)
+            
+            payload = {
+                "message": message,
+                "content": base64.b64encode(content.encode('utf-8')).decode('ascii')
+            }
             
+            # PUT straight away, with the sha we last saw for this path if any;
+            # only a 409/422 (sha missing or out of date) costs a lookup and retry
+            with self._cache_lock:
+                sha = self._content_shas.get(url)
+            response = await self._request("PUT", url, json={**payload, "sha": sha} if sha else payload)
+            if response.status_code in (409, 422):
+                sha = await self._current_sha(url)
+                response = await self._request("PUT", url, json={**payload, "sha": sha} if sha else payload)
+            response.raise_for_status()
+            
+            result = orjson.loads(response.content)
+            new_sha = result["content"].get("sha")
+            if new_sha:
+                with self._cache_lock:
+                    self._content_shas[url] = new_sha
             return {
-                "commit_sha": result["commit"].sha,
-                "url": result["content"].html_url,
-                "action": action,
+                "commit_sha": result["commit"]["sha"],
+                "url": result["content"]["html_url"],
+                "action": "created" if response.status_code == 201 else "updated",
                 "path": path
             }
-        except GithubException as e:
-            raise Exception(f"Failed to commit file: {e.data.get('message', str(e))}")
+        except httpx.HTTPStatusError as e:
+            raise self._http_error("Failed to commit file", e.response)
     
-    def read_file(self, repo_full_name: str, path: str) -> Dict:
+    async def commit_files(self, repo_full_name: str, files: Dict[str, str], message: str, branch: Optional[str] = None) -> Dict:
+        """
+        Create or update several files in a single commit
+        
+        Goes through the Git Data API: the blobs are uploaded concurrently
+        (identical contents only once), then one tree, one commit and one ref
+        update, however many files there are. Files are written as regular
+        (non-executable) files.
+        
+        Args:
+            repo_full_name: Full repository name (e.g., "username/repo")
+            files: Mapping of file path -> file content
+            message: Commit message
+            branch: Branch to commit to (default: the repository's default branch)
+            
+        Returns:
+            Dict with keys: commit_sha, url, paths
+        """
+        try:
+            self._validate_repo_name(repo_full_name)
+            if not files:
+                raise ValueError("No files to commit")
+            
+            contents = list(dict.fromkeys(files.values()))
+            tip, *blob_shas = await asyncio.gather(
+                self._branch_tip(repo_full_name, branch),
+                *(self._create_blob(repo_full_name, content) for content in contents)
+            )
+            blob_of = dict(zip(contents, blob_shas))
+            return await self._commit_tree(
+                repo_full_name, tip, {path: blob_of[content] for path, content in files.items()}, message
+            )
+        except httpx.HTTPStatusError as e:
+            raise self._http_error("Failed to commit files", e.response)
+    
+    async def commit_files_from_blob(self, repo_full_name: str, blob_sha: str, paths: List[str], message: str, branch: Optional[str] = None) -> Dict:
+        """
+        Write one existing blob to several paths in a single commit
+        
+        Upload the content once with create_blob, then reference it from as
+        many paths (or commits) as needed without encoding or sending it again.
+        
+        Args:
+            repo_full_name: Full repository name (e.g., "username/repo")
+            blob_sha: Sha returned by create_blob
+            paths: File paths in repository
+            message: Commit message
+            branch: Branch to commit to (default: the repository's default branch)
+            
+        Returns:
+            Dict with keys: commit_sha, url, paths
+        """
+        try:
+            self._validate_repo_name(repo_full_name)
+            if not paths:
+                raise ValueError("No files to commit")
+            tip = await self._branch_tip(repo_full_name, branch)
+            return await self._commit_tree(repo_full_name, tip, dict.fromkeys(paths, blob_sha), message)
+        except httpx.HTTPStatusError as e:
+            raise self._http_error("Failed to commit files", e.response)
+    
+    async def create_blob(self, repo_full_name: str, content: str) -> str:
+        """
+        Upload file content as a Git blob
+        
+        Args:
+            repo_full_name: Full repository name (e.g., "username/repo")
+            content: File content
+            
+        Returns:
+            The blob sha, for commit_files_from_blob
+        """
+        try:
+            self._validate_repo_name(repo_full_name)
+            return await self._create_blob(repo_full_name, content)
+        except httpx.HTTPStatusError as e:
+            raise self._http_error("Failed to create blob", e.response)
+    
+    async def read_file(self, repo_full_name: str, path: str) -> Dict:
         """
         Read a file from a repository
         
@@ -188,19 +619,408 @@ class GitHubClient:
         """
         try:
             self._validate_repo_name(repo_full_name)
-            repo = self.github.get_repo(repo_full_name)
-            file_content = repo.get_contents(path)
+            url = self._contents_url(repo_full_name, path)
+            _, file_content = await self._conditional_get(url)
+            if not isinstance(file_content, dict) or file_content.get("type") != "file":
+                raise GitHubError(f"Not a file: {path}")
+            with self._cache_lock:
+                self._content_shas[url] = file_content["sha"]
+            
+            # Files over 1 MB come back without inline content; fetch them again
+            # as raw bytes rather than as a base64 blob
+            encoded = file_content.get("content")
+            if encoded:
+                raw = base64.b64decode(encoded)
+            else:
+                _, raw = await self._conditional_get(url, raw=True)
             
             return {
-                "path": file_content.path,
-                "content": file_content.decoded_content.decode('utf-8'),
-                "url": file_content.html_url,
-                "size": file_content.size
+                "path": file_content["path"],
+                "content": raw.decode('utf-8'),
+                "url": file_content["html_url"],
+                "size": file_content["size"]
             }
-        except GithubException as e:
-            if e.status == 404:
-                raise Exception(f"File not found: {path}")
-            raise Exception(f"Failed to read file: {e.data.get('message', str(e))}")
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code == 404:
+                raise GitHubNotFoundError(f"File not found: {path}", 404)
+            raise self._http_error("Failed to read file", e.response)
+    
+    async def _request(self, method: str, url: str, **kwargs) -> httpx.Response:
+        """
+        Send a request through the throttle, re-queueing it when rate limited
+        
+        The wait comes from Retry-After or X-RateLimit-Reset when GitHub gives
+        one, else it backs off exponentially from RATE_LIMIT_BACKOFF; either
+        way a second of jitter is added so held-back requests don't all resume
+        together. Waits longer than MAX_RETRY_AFTER return the response as is.
+        
+        Args:
+            method: HTTP method
+            url: API path (e.g. "/user/repos") or absolute API URL
+            **kwargs: Passed to httpx (params, json, headers)
+            
+        Returns:
+            The final httpx.Response
+        """
+        headers = {**self.headers, **kwargs.pop("headers", {})}
+        if "json" in kwargs:
+            # orjson serialises straight to bytes, faster than httpx's json.dumps
+            kwargs["content"] = orjson.dumps(kwargs.pop("json"))
+            headers["Content-Type"] = "application/json"
+        
+        for attempt in range(RATE_LIMIT_RETRIES + 1):
+            await self.throttle.acquire()
+            response = await _send(method, url, headers=headers, **kwargs)
+            wait = self.throttle.update(response.status_code, response.headers)
+            if wait is None and self._is_rate_limited(response):
+                wait = RATE_LIMIT_BACKOFF * 2 ** attempt
+            if wait is None or wait > MAX_RETRY_AFTER or attempt == RATE_LIMIT_RETRIES:
+                break
+            # The next acquire() sleeps until the block lifts
+            self.throttle.block(min(wait + random.uniform(0, 1), MAX_RETRY_AFTER))
+        
+        # A write may change anything we've cached (GraphQL here is read-only)
+        if method != "GET" and url != GITHUB_GRAPHQL_URL:
+            self._expire_cached_responses()
+        return response
+    
+    async def _conditional_get(self, url: str, parameters: Optional[Dict] = None, raw: bool = False) -> Tuple[httpx.Headers, Any]:
+        """
+        GET a REST resource through the response cache
+        
+        A response younger than its TTL (cache_ttl, or the server's shorter
+        Cache-Control max-age) is returned without a request. Older ones are
+        revalidated with If-None-Match; a 304 reply has no body and doesn't
+        count against the rate limit, so the stored copy is reused.
+        
+        Args:
+            url: API path (e.g. "/user/repos") or absolute API URL
+            parameters: Query parameters
+            raw: Request the raw media type and return the body as bytes
+            
+        Returns:
+            Tuple of (response headers, parsed JSON body or raw bytes)
+        """
+        key = (url, tuple(sorted((parameters or {}).items())), raw)
+        with self._cache_lock:
+            stored = self._response_cache.get(key)
+        if stored and time.monotonic() < stored[1]:
+            return stored[2], stored[3]
+        
+        request_headers = {"If-None-Match": stored[0]} if stored and stored[0] else {}
+        if raw:
+            request_headers["Accept"] = "application/vnd.github.raw"
+        response = await self._request("GET", url, params=parameters, headers=request_headers)
+        
+        if response.status_code == 304 and stored:
+            data = stored[3]
+        else:
+            response.raise_for_status()
+            data = response.content if raw else orjson.loads(response.content) if response.content else None
+        
+        etag = response.headers.get("etag") if self.use_etag else None
+        if etag or self.cache_ttl > 0:
+            ttl = self.cache_ttl
+            max_age = _MAX_AGE_RE.search(response.headers.get("cache-control", ""))
+            if max_age:
+                ttl = min(ttl, int(max_age.group(1)))
+            with self._cache_lock:
+                self._response_cache[key] = (etag, time.monotonic() + ttl, response.headers, data)
+        return response.headers, data
+    
+    async def _current_sha(self, url: str) -> Optional[str]:
+        """Blob sha of the file at a contents URL, or None if it doesn't exist"""
+        try:
+            _, existing = await self._conditional_get(url)
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code != 404:
+                raise
+            return None
+        return existing["sha"]
+    
+    async def _create_blob(self, repo_full_name: str, content: str) -> str:
+        """POST a blob and return its sha"""
+        blob = await self._send_json("POST", f"/repos/{repo_full_name}/git/blobs", {
+            "content": base64.b64encode(content.encode('utf-8')).decode('ascii'),
+            "encoding": "base64"
+        })
+        return blob["sha"]
+    
+    async def _branch_tip(self, repo_full_name: str, branch: Optional[str]) -> Tuple[str, str, str]:
+        """
+        Resolve the commit to build on
+        
+        Returns:
+            Tuple of (ref path, tip commit sha, tip tree sha)
+        """
+        if branch is None:
+            branch = await self._default_branch(repo_full_name)
+        ref = f"heads/{urllib.parse.quote(branch)}"
+        git = f"/repos/{repo_full_name}/git"
+        
+        # The tip must be current, so skip the response cache
+        response = await self._request("GET", f"{git}/ref/{ref}")
+        response.raise_for_status()
+        head_sha = orjson.loads(response.content)["object"]["sha"]
+        _, commit = await self._conditional_get(f"{git}/commits/{head_sha}")
+        return ref, head_sha, commit["tree"]["sha"]
+    
+    async def _commit_tree(self, repo_full_name: str, tip: Tuple[str, str, str], blobs: Dict[str, str], message: str) -> Dict:
+        """
+        Commit blobs on top of a branch tip and move the branch to it
+        
+        Args:
+            repo_full_name: Full repository name
+            tip: Result of _branch_tip
+            blobs: Mapping of file path -> blob sha
+            message: Commit message
+            
+        Returns:
+            Dict with keys: commit_sha, url, paths
+        """
+        ref, head_sha, base_tree = tip
+        git = f"/repos/{repo_full_name}/git"
+        paths = {path.lstrip('/'): sha for path, sha in blobs.items()}
+        
+        tree = await self._send_json("POST", f"{git}/trees", {
+            "base_tree": base_tree,
+            "tree": [
+                {"path": path, "mode": "100644", "type": "blob", "sha": sha}
+                for path, sha in paths.items()
+            ]
+        })
+        commit = await self._send_json("POST", f"{git}/commits", {
+            "message": message,
+            "tree": tree["sha"],
+            "parents": [head_sha]
+        })
+        await self._send_json("PATCH", f"{git}/refs/{ref}", {"sha": commit["sha"]})
+        
+        # A contents sha is the blob sha, so later commit_file calls can PUT directly
+        with self._cache_lock:
+            for path, sha in paths.items():
+                self._content_shas[self._contents_url(repo_full_name, path)] = sha
+        return {
+            "commit_sha": commit["sha"],
+            "url": commit["html_url"],
+            "paths": list(paths)
+        }
+    
+    async def _default_branch(self, repo_full_name: str) -> str:
+        """Default branch of a repository, fetched once per client"""
+        with self._cache_lock:
+            branch = self._default_branches.get(repo_full_name)
+        if branch is None:
+            _, repo = await self._conditional_get(f"/repos/{repo_full_name}")
+            branch = repo["default_branch"]
+            with self._cache_lock:
+                self._default_branches[repo_full_name] = branch
+        return branch
+    
+    async def _send_json(self, method: str, url: str, payload: Dict) -> Any:
+        """Send a JSON body and return the parsed reply, raising on HTTP errors"""
+        response = await self._request(method, url, json=payload)
+        response.raise_for_status()
+        return orjson.loads(response.content)
+    
+    async def _graphql(self, query: str, variables: Optional[Dict] = None, action: str = "GraphQL query failed") -> Dict:
+        """
+        Run a GraphQL query
+        
+        Args:
+            query: GraphQL query document
+            variables: Query variables
+            action: Prefix for the GitHubError raised when the query reports errors
+            
+        Returns:
+            The response's data object
+        """
+        response = await self._request("POST", GITHUB_GRAPHQL_URL, json={"query": query, "variables": variables or {}})
+        response.raise_for_status()
+        result = orjson.loads(response.content)
+        if result.get("errors"):
+            messages = "; ".join(error.get("message", "Unknown error") for error in result["errors"])
+            raise GitHubError(f"{action}: {messages}")
+        return result["data"]
+    
+    def _expire_cached_responses(self):
+        """Mark every cached GET stale (ETags are kept for cheap revalidation)"""
+        with self._cache_lock:
+            for key, (etag, _, headers, data) in list(self._response_cache.items()):
+                if etag:
+                    self._response_cache[key] = (etag, 0.0, headers, data)
+                else:
+                    del self._response_cache[key]
+    
+    async def paginate(self, url: str, parameters: Optional[Dict] = None) -> List[List[Dict]]:
+        """
+        Fetch every page of a list endpoint
+        
+        The first page's Link: rel="last" gives the page count, so the rest are
+        fetched concurrently (PAGE_CONCURRENCY at a time, still paced by the
+        throttle). Without it, rel="next" links are followed one by one.
+        
+        Args:
+            url: API path of the list endpoint
+            parameters: Query parameters (per_page defaults to PER_PAGE)
+            
+        Returns:
+            The JSON array of each page, in page order
+        """
+        parameters = {"per_page": PER_PAGE, **(parameters or {})}
+        headers, first_page = await self._conditional_get(url, parameters)
+        last_page = self._last_page(headers)
+        
+        if last_page is not None:
+            async def fetch_page(page: int) -> List[Dict]:
+                _, items = await self._conditional_get(url, {**parameters, "page": page})
+                return items
+            
+            return [first_page, *await map_concurrent(range(2, last_page + 1), fetch_page, PAGE_CONCURRENCY)]
+        
+        pages = [first_page]
+        next_url = self._next_url(headers)
+        while next_url:
+            headers, page = await self._conditional_get(next_url)
+            pages.append(page)
+            next_url = self._next_url(headers)
+        return pages
+    
+    async def iter_pages(self, url: str, parameters: Optional[Dict] = None, prefetch: int = 1) -> AsyncIterator[List[Dict]]:
+        """
+        Yield each page of a list endpoint in order, fetching ahead of the caller
+        
+        Up to ``prefetch`` later pages are requested while the caller handles the
+        current one (only one when pages are discovered through rel="next").
+        Pending requests are cancelled if the caller stops early.
+        
+        Args:
+            url: API path of the list endpoint
+            parameters: Query parameters (per_page defaults to PER_PAGE)
+            prefetch: Pages to request ahead; 0 fetches each page on demand
+            
+        Yields:
+            The JSON array of each page
+        """
+        parameters = {"per_page": PER_PAGE, **(parameters or {})}
+        headers, page = await self._conditional_get(url, parameters)
+        last_page = self._last_page(headers)
+        next_page = 2
+        next_url = self._next_url(headers)
+        pending = deque()
+        
+        def schedule() -> bool:
+            """Request the next unrequested page, if its address is known yet"""
+            nonlocal next_page, next_url
+            if last_page is not None:
+                if next_page > last_page:
+                    return False
+                pending.append(asyncio.ensure_future(self._conditional_get(url, {**parameters, "page": next_page})))
+                next_page += 1
+                return True
+            # Without rel="last", only the page after the newest fetched one is known
+            if next_url is None:
+                return False
+            pending.append(asyncio.ensure_future(self._conditional_get(next_url)))
+            next_url = None
+            return True
+        
+        try:
+            while True:
+                while len(pending) < prefetch and schedule():
+                    pass
+                yield page
+                if not pending and not schedule():
+                    return
+                headers, page = await pending.popleft()
+                if last_page is None:
+                    next_url = self._next_url(headers)
+        finally:
+            for task in pending:
+                task.cancel()
+    
+    @staticmethod
+    def _next_url(headers: Mapping[str, str]) -> Optional[str]:
+        """URL of the Link: rel="next" relation (query string included), or None"""
+        next_link = _NEXT_LINK_RE.search(headers.get("link", ""))
+        return next_link.group(1) if next_link else None
+    
+    @staticmethod
+    def _last_page(headers: Mapping[str, str]) -> Optional[int]:
+        """Page number of the Link: rel="last" relation, or None if absent"""
+        last_link = _LAST_LINK_RE.search(headers.get("link", ""))
+        if not last_link:
+            return None
+        query = urllib.parse.parse_qs(urllib.parse.urlsplit(last_link.group(1)).query)
+        return int(query.get("page", ["0"])[0]) or None
+    
+    @staticmethod
+    def _repo_info(repo: Dict) -> RepoInfo:
+        """Shape a repository from the REST API into a RepoInfo"""
+        return RepoInfo(repo["name"], repo["html_url"], repo["private"], repo["description"] or "")
+    
+    @staticmethod
+    def _issue_info(issue: Dict) -> IssueInfo:
+        """Shape an issue from the REST API into an IssueInfo"""
+        return IssueInfo(issue["number"], issue["title"], issue["html_url"], issue["state"])
+    
+    @staticmethod
+    def _contents_url(repo_full_name: str, path: str) -> str:
+        """Contents API URL of a file"""
+        return f"/repos/{repo_full_name}/contents/{urllib.parse.quote(path.lstrip('/'))}"
+    
+    @staticmethod
+    def _is_rate_limited(response: httpx.Response) -> bool:
+        """Whether a reply is a (secondary) rate limit rather than a plain refusal"""
+        if response.status_code == 429:
+            return True
+        return response.status_code == 403 and (
+            "retry-after" in response.headers
+            or response.headers.get("x-ratelimit-remaining") == "0"
+            or "rate limit" in response.text.lower()
+        )
+    
+    @classmethod
+    def _http_error(cls, action: str, response: httpx.Response) -> GitHubError:
+        """
+        Wrap a failed response in the GitHubError subclass matching its status
+        
+        Args:
+            action: What failed, e.g. "Failed to list issues"
+            response: The error response
+            
+        Returns:
+            GitHubNotFoundError, GitHubRateLimitError, GitHubServerError or
+            GitHubError, to be raised by the caller
+        """
+        message = f"{action}: {cls._error_message(response)}"
+        status = response.status_code
+        if status == 404:
+            return GitHubNotFoundError(message, status)
+        if status >= 500:
+            return GitHubServerError(message, status)
+        if cls._is_rate_limited(response):
+            retry_after = response.headers.get("retry-after")
+            reset = response.headers.get("x-ratelimit-reset")
+            if retry_after is not None:
+                retry_after = float(retry_after)
+            elif reset is not None and response.headers.get("x-ratelimit-remaining") == "0":
+                retry_after = max(float(reset) - time.time(), 0.0)
+            return GitHubRateLimitError(message, status, retry_after)
+        return GitHubError(message, status)
+    
+    @staticmethod
+    def _error_message(response: httpx.Response) -> str:
+        """Extract GitHub's error message from a failed response"""
+        try:
+            return orjson.loads(response.content).get("message", response.text)
+        except ValueError:
+            return response.text or f"HTTP {response.status_code}"
+    
+    @staticmethod
+    def _is_valid_repo_name(repo_full_name: str) -> bool:
+        """Whether repo_full_name looks like "owner/repo" (no exception, for tight loops)"""
+        return bool(repo_full_name) and _REPO_NAME_RE.fullmatch(repo_full_name) is not None
     
     @staticmethod
     def _validate_repo_name(repo_full_name: str):
@@ -213,13 +1033,148 @@ class GitHubClient:
         Raises:
             ValueError: If format is invalid
         """
-        if not repo_full_name or "/" not in repo_full_name:
-            raise ValueError(
-                "Invalid repository name. Must be in format 'username/repo'"
-            )
+        if not AsyncGitHubClient._is_valid_repo_name(repo_full_name):
+            raise ValueError(_INVALID_REPO_MSG)
+
+
+class GitHubClient:
+    """
+    Blocking GitHub API client wrapper for automation tasks
+    
+    Each call runs the matching AsyncGitHubClient coroutine on a shared
+    background event loop; use ``aio`` directly from async code.
+    """
+    
+    def __init__(self, token: Optional[str] = None, cache_ttl: int = RESPONSE_CACHE_TTL, use_etag: bool = True):
+        """
+        Initialize GitHub client with access token
         
-        parts = repo_full_name.split("/")
-        if len(parts) != 2 or not all(parts):
-            raise ValueError(
-                "Invalid repository name. Must be in format 'username/repo'"
-            )
+        Args:
+            token: GitHub Personal Access Token (if None, reads from GITHUB_TOKEN env var)
+            cache_ttl: Seconds a GET response is reused without a request (0 disables)
+            use_etag: Revalidate stale responses with If-None-Match
+        """
+        self.aio = AsyncGitHubClient(token, cache_ttl, use_etag)
+        self.token = self.aio.token
+    
+    def create_repo(self, name: str, private: bool = False, description: str = "") -> Dict:
+        """
+        Create a new GitHub repository
+        
+        Args:
+            name: Repository name
+            private: Whether repo should be private (default: False for public)
+            description: Repository description
+            
+        Returns:
+            Dict with keys: name, url, private
+        """
+        return run_sync(self.aio.create_repo(name, private, description))
+    
+    def list_repos(self) -> List[RepoInfo]:
+        """
+        List all repositories for the authenticated user
+        
+        Returns:
+            List of RepoInfo (name, url, private, description)
+        """
+        return run_sync(self.aio.list_repos())
+    
+    def create_issue(self, repo_full_name: str, title: str, body: str = "") -> Dict:
+        """
+        Create an issue in a repository
+        
+        Args:
+            repo_full_name: Full repository name (e.g., "username/repo")
+            title: Issue title
+            body: Issue body/description
+            
+        Returns:
+            Dict with keys: number, url, title, state
+        """
+        return run_sync(self.aio.create_issue(repo_full_name, title, body))
+    
+    def list_issues(self, repo_full_name: str, state: str = "open") -> List[IssueInfo]:
+        """
+        List issues in a repository
+        
+        Args:
+            repo_full_name: Full repository name (e.g., "username/repo")
+            state: Issue state filter ("open", "closed", or "all")
+            
+        Returns:
+            List of IssueInfo (number, title, url, state)
+        """
+        return run_sync(self.aio.list_issues(repo_full_name, state))
+    
+    def commit_file(self, repo_full_name: str, path: str, content: str, message: str) -> Dict:
+        """
+        Create or update a file in a repository
+        
+        Args:
+            repo_full_name: Full repository name (e.g., "username/repo")
+            path: File path in repository
+            content: File content
+            message: Commit message
+            
+        Returns:
+            Dict with keys: commit_sha, url, action (created/updated)
+        """
+        return run_sync(self.aio.commit_file(repo_full_name, path, content, message))
+    
+    def commit_files(self, repo_full_name: str, files: Dict[str, str], message: str, branch: Optional[str] = None) -> Dict:
+        """
+        Create or update several files in a single commit
+        
+        Args:
+            repo_full_name: Full repository name (e.g., "username/repo")
+            files: Mapping of file path -> file content
+            message: Commit message
+            branch: Branch to commit to (default: the repository's default branch)
+            
+        Returns:
+            Dict with keys: commit_sha, url, paths
+        """
+        return run_sync(self.aio.commit_files(repo_full_name, files, message, branch))
+    
+    def commit_files_from_blob(self, repo_full_name: str, blob_sha: str, paths: List[str], message: str, branch: Optional[str] = None) -> Dict:
+        """
+        Write one existing blob to several paths in a single commit
+        
+        Args:
+            repo_full_name: Full repository name (e.g., "username/repo")
+            blob_sha: Sha returned by create_blob
+            paths: File paths in repository
+            message: Commit message
+            branch: Branch to commit to (default: the repository's default branch)
+            
+        Returns:
+            Dict with keys: commit_sha, url, paths
+        """
+        return run_sync(self.aio.commit_files_from_blob(repo_full_name, blob_sha, paths, message, branch))
+    
+    def create_blob(self, repo_full_name: str, content: str) -> str:
+        """
+        Upload file content as a Git blob
+        
+        Args:
+            repo_full_name: Full repository name (e.g., "username/repo")
+            content: File content
+            
+        Returns:
+            The blob sha, for commit_files_from_blob
+        """
+        return run_sync(self.aio.create_blob(repo_full_name, content))
+    
+    def read_file(self, repo_full_name: str, path: str) -> Dict:
+        """
+        Read a file from a repository
+        
+        Args:
+            repo_full_name: Full repository name (e.g., "username/repo")
+            path: File path in repository
+            
+        Returns:
+            Dict with keys: path, content, url
+        """
+        return run_sync(self.aio.read_file(repo_full_name, path))
@@ -1,13 +1,21 @@
 def calculate_fibonacci(n):
-    """Calculate the nth Fibonacci number using recursion."""
+    """Calculate the nth Fibonacci number iteratively in O(n) steps."""
     if n <= 1:
         return n
-    return calculate_fibonacci(n-1) + calculate_fibonacci(n-2)
+    a, b = 0, 1
+    for _ in range(n):
+        a, b = b, a + b
+    return a
 
 def main():
     """Main function to demonstrate Fibonacci calculation."""
+    # Walk the sequence once instead of recomputing it for every index
+    a, b = 0, 1
+    lines = []
     for i in range(10):
-        print(f"Fibonacci({i}) = {calculate_fibonacci(i)}")
+        lines.append(f"Fibonacci({i}) = {a}")
+        a, b = b, a + b
+    print("\n".join(lines))
 
 if __name__ == "__main__":
     main()